@@ -4,73 +4,226 @@ Simple HTTP server for ROKO token data
 Serves JSON files from the public directory with proper CORS headers and ETag support
 """
 
+import io
 import os
 import sys
-import json
+import stat
+import gzip
+import socket
 import hashlib
 import argparse
-from datetime import datetime, timezone
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+import tempfile
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 from functools import partial
-from pathlib import Path
+
+# Constant headers for JSON responses, formatted once instead of per send_header() call
+_JSON_304_HEADERS = (
+    'Cache-Control: public, max-age=900, must-revalidate\r\n'
+    'Vary: Accept-Encoding\r\n'
+    'Access-Control-Allow-Origin: *\r\n'
+)
+_JSON_200_HEADERS = (
+    'Content-Type: application/json\r\n'
+    + _JSON_304_HEADERS +
+    'Access-Control-Allow-Methods: GET, OPTIONS\r\n'
+    'Access-Control-Allow-Headers: Content-Type\r\n'
+)
+
+# Files whose gzip variant could not be written: (path, mtime_ns, size), retried only once the file changes
+_gzip_failures = set()
+_GZIP_FAILURES_SIZE = 1024
+
+# Rendered directory listings: (url path, fs path) -> (dir mtime_ns, html bytes)
+_listing_cache = {}
+_LISTING_CACHE_SIZE = 128
+
+# CORS and cache headers added to every other response by end_headers()
+_DEFAULT_HEADERS = (
+    'Access-Control-Allow-Origin: *\r\n'
+    'Access-Control-Allow-Methods: GET, OPTIONS\r\n'
+    'Access-Control-Allow-Headers: Content-Type\r\n'
+    'Cache-Control: public, max-age=3600\r\n'  # Cache other files for 1 hour
+).encode('latin-1')
+
+def accepts_gzip(accept_encoding):
+    """Check whether an Accept-Encoding header allows gzip (honouring q-values such as gzip;q=0)."""
+    gzip_q = wildcard_q = None
+    for part in accept_encoding.split(','):
+        coding, _, params = part.partition(';')
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ('gzip', 'x-gzip'):
+            gzip_q = q
+        elif coding == '*':
+            wildcard_q = q
+    if gzip_q is None:
+        gzip_q = wildcard_q
+    return gzip_q is not None and gzip_q > 0
 
 class CORSRequestHandler(SimpleHTTPRequestHandler):
     """HTTP request handler with CORS headers and ETag support."""
 
-    def get_etag_for_json(self, filepath):
-        """Generate ETag based on JSON timestamp field."""
+    # Keep client connections open between requests; every response sets Content-Length
+    protocol_version = 'HTTP/1.1'
+
+    # Set per request when the response carries its own CORS and cache headers
+    sends_own_headers = False
+
+    def handle_one_request(self):
+        """Reset per-request state; one handler serves every request on a kept-alive connection."""
+        self.sends_own_headers = False
+        super().handle_one_request()
+
+    def setup(self):
+        """Disable Nagle so small responses on kept-alive connections are not delayed."""
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def set_cork(self, enabled):
+        """Hold back partial frames while corked (Linux TCP_CORK; no-op elsewhere)."""
+        if hasattr(socket, 'TCP_CORK'):
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, int(enabled))
+
+    def get_etag_for_json(self, filepath, file_stat=None):
+        """Generate ETag from the file's modification time and size."""
+        if file_stat is None:
+            file_stat = os.stat(filepath)
+        # The updater rewrites the file on every cycle, so (mtime_ns, size) identifies its content
+        etag_source = f"{file_stat.st_mtime_ns}-{file_stat.st_size}"
+        etag = f'"{hashlib.blake2b(etag_source.encode(), digest_size=12).hexdigest()}"'
+        return etag, int(file_stat.st_mtime)
+
+    def is_fresh_variant(self, variant_path, source_stat):
+        """Check that a precompressed variant exists and is not older than its source."""
+        try:
+            return os.stat(variant_path).st_mtime_ns >= source_stat.st_mtime_ns
+        except OSError:
+            return False
+
+    def ensure_gzip_variant(self, source_path, source_stat):
+        """Return a fresh gzip copy of a file, compressing it once per change, or None."""
+        gzip_path = source_path + '.gz'
+        if self.is_fresh_variant(gzip_path, source_stat):
+            return gzip_path
+
+        # Don't compress a file whose variant can't be saved (read-only directory, earlier failure)
+        failure_key = (source_path, source_stat.st_mtime_ns, source_stat.st_size)
+        source_dir = os.path.dirname(source_path)
+        if failure_key in _gzip_failures or not os.access(source_dir, os.W_OK):
+            return None
+
+        tmp_path = None
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-                # Use the timestamp from the JSON content
-                timestamp = data.get('timestamp', 0)
-                # Also include file size for extra uniqueness
-                file_size = os.path.getsize(filepath)
-                # Create ETag from timestamp and size
-                etag_source = f"{timestamp}-{file_size}"
-                etag = hashlib.md5(etag_source.encode()).hexdigest()
-                return f'"{etag}"', timestamp
-        except (json.JSONDecodeError, FileNotFoundError, KeyError):
-            # Fallback to file modification time
-            stat = os.stat(filepath)
-            etag_source = f"{stat.st_mtime}-{stat.st_size}"
-            etag = hashlib.md5(etag_source.encode()).hexdigest()
-            return f'"{etag}"', int(stat.st_mtime)
-
-    def serve_json_file(self, path):
+            with open(source_path, 'rb') as f:
+                # The updater may have replaced the file since it was stat'ed; never label old bytes as new
+                opened_stat = os.fstat(f.fileno())
+                if (opened_stat.st_mtime_ns, opened_stat.st_size) != (source_stat.st_mtime_ns, source_stat.st_size):
+                    return None
+                compressed = gzip.compress(f.read(), compresslevel=9)
+            # Write to a private temp file and rename so concurrent requests never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=source_dir, suffix='.gz.tmp')
+            os.fchmod(fd, 0o644)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(compressed)
+            # Stamp the variant with its source's mtime: if a newer source lands before the rename,
+            # this copy is older than it and fails is_fresh_variant instead of being served as current
+            os.utime(tmp_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+            os.replace(tmp_path, gzip_path)
+            return gzip_path
+        except OSError:
+            # Don't leave a partial temp file in the served directory
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            # Read-only directory or similar: serve the uncompressed file until it changes
+            if len(_gzip_failures) >= _GZIP_FAILURES_SIZE:
+                _gzip_failures.clear()
+            _gzip_failures.add(failure_key)
+            return None
+
+    def serve_json_file(self, path, file_stat=None):
         """Serve a JSON file with ETag and cache headers."""
-        etag, timestamp = self.get_etag_for_json(path)
+        if file_stat is None:
+            file_stat = os.stat(path)
+        etag, timestamp = self.get_etag_for_json(path, file_stat)
+
+        # Serve a precompressed copy (written by the updater or generated here) if the client accepts gzip
+        content_encoding = None
+        if accepts_gzip(self.headers.get('Accept-Encoding', '')):
+            gzip_path = self.ensure_gzip_variant(path, file_stat)
+            if gzip_path:
+                content_encoding = 'gzip'
+                etag = f'{etag[:-1]}-gzip"'
+                path = gzip_path
 
         # Check If-None-Match header
         client_etag = self.headers.get('If-None-Match')
         if client_etag and client_etag == etag:
             # Content hasn't changed, return 304
-            self.send_response(304)
-            self.send_header('ETag', etag)
-            self.send_header('Cache-Control', 'public, max-age=900, must-revalidate')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
+            self.write_response_head(304, f'ETag: {etag}\r\n' + _JSON_304_HEADERS)
             return
 
         # Serve the file with ETag
         try:
             with open(path, 'rb') as f:
-                content = f.read()
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Content-Length', str(len(content)))
-                self.send_header('ETag', etag)
+                headers = f'Content-Length: {os.fstat(f.fileno()).st_size}\r\n'
+                if content_encoding:
+                    headers += f'Content-Encoding: {content_encoding}\r\n'
                 # Cache for 15 minutes (same as update interval)
-                self.send_header('Cache-Control', 'public, max-age=900, must-revalidate')
-                self.send_header('Last-Modified', self.date_time_string(timestamp))
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
-                self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-                self.end_headers()
-                self.wfile.write(content)
+                headers += f'ETag: {etag}\r\nLast-Modified: {self.date_time_string(timestamp)}\r\n'
+                # Cork so the headers and the start of the body leave in the same segment
+                self.set_cork(True)
+                try:
+                    self.write_response_head(200, headers + _JSON_200_HEADERS)
+                    # Zero-copy file -> socket transfer (socket.sendfile falls back to send() if needed)
+                    self.connection.sendfile(f)
+                finally:
+                    self.set_cork(False)
         except IOError:
             self.send_error(404, "File not found")
 
+    def write_response_head(self, code, headers):
+        """Log the request and write the status line and headers in a single write."""
+        self.log_request(code)
+        head = (f'{self.protocol_version} {code} {self.responses[code][0]}\r\n'
+                f'Server: {self.version_string()}\r\n'
+                f'Date: {self.date_time_string()}\r\n'
+                f'{headers}\r\n')
+        self.wfile.write(head.encode('latin-1', 'strict'))
+
+    def list_directory(self, path):
+        """Serve a directory listing, re-rendering only when the directory changes."""
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return super().list_directory(path)
+
+        key = (self.path, path)
+        cached = _listing_cache.get(key)
+        if cached and cached[0] == mtime_ns:
+            body = cached[1]
+            self.send_response(200)
+            self.send_header('Content-type', f'text/html; charset={sys.getfilesystemencoding()}')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            return io.BytesIO(body)
+
+        f = super().list_directory(path)
+        if f is not None:
+            if len(_listing_cache) >= _LISTING_CACHE_SIZE:
+                _listing_cache.clear()
+            _listing_cache[key] = (mtime_ns, f.getvalue())
+        return f
+
     def do_GET(self):
         """Handle GET requests with ETag support."""
         # Strip /token prefix if present (for Cloudflare routing)
@@ -87,13 +240,18 @@ class CORSRequestHandler(SimpleHTTPRequestHandler):
         # Translate path to filesystem path
         path = self.translate_path(self.path)
 
-        # Check if file exists
-        if not os.path.exists(path):
+        # JSON files and the /price endpoint send their own CORS and cache headers
+        self.sends_own_headers = path.endswith('.json') or self.path == '/price' or path.endswith('/price')
+
+        # Check if file exists (one stat, following symlinks, answers both existence and type)
+        try:
+            st = os.stat(path)
+        except OSError:
             self.send_error(404, "File not found")
             return
 
         # Check if it's a directory
-        if os.path.isdir(path):
+        if stat.S_ISDIR(st.st_mode):
             # Try to serve index file
             for index in ["index.html", "index.htm"]:
                 index_path = os.path.join(path, index)
@@ -106,15 +264,14 @@ class CORSRequestHandler(SimpleHTTPRequestHandler):
                 return
 
         # For JSON files (including symlinked files), use smart ETag
-        # Check if it's a JSON file or the /price endpoint
-        if path.endswith('.json') or self.path == '/price' or path.endswith('/price'):
-            # Resolve symlinks to get the actual file
+        if self.sends_own_headers:
+            # Resolve symlinks to get the actual file (already known to exist from the stat above)
             real_path = os.path.realpath(path)
-            # Make sure the resolved path exists and is a JSON file
-            if os.path.exists(real_path) and (real_path.endswith('.json') or os.path.basename(real_path) == 'roko-price.json'):
-                self.serve_json_file(real_path)
+            # Make sure the resolved path is a JSON file
+            if real_path.endswith('.json') or os.path.basename(real_path) == 'roko-price.json':
+                self.serve_json_file(real_path, st)
             else:
-                self.serve_json_file(path)
+                self.serve_json_file(path, st)
             return
         else:
             # For non-JSON files, use standard handling
@@ -122,12 +279,9 @@ class CORSRequestHandler(SimpleHTTPRequestHandler):
 
     def end_headers(self):
         """Add CORS headers to all responses (for non-JSON files)."""
-        # Only add these if not already set (JSON files handle their own)
-        if not self.path.endswith('.json') and self.path != '/price':
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
-            self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-            self.send_header('Cache-Control', 'public, max-age=3600')  # Cache other files for 1 hour
+        # Only add these if not already set (JSON files and preflights handle their own)
+        if not self.sends_own_headers:
+            self._headers_buffer.append(_DEFAULT_HEADERS)
         super().end_headers()
 
     def do_OPTIONS(self):
@@ -136,11 +290,13 @@ class CORSRequestHandler(SimpleHTTPRequestHandler):
         if self.path.startswith('/token'):
             self.path = self.path[6:] or '/'
 
+        self.sends_own_headers = True
         self.send_response(200)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         self.send_header('Cache-Control', 'max-age=86400')  # Cache preflight for 24 hours
+        self.send_header('Content-Length', '0')
         self.end_headers()
 
     def log_message(self, format, *args):
@@ -168,7 +324,7 @@ def run_server(port=8080, directory=None):
     handler = partial(CORSRequestHandler, directory=directory or '.')
 
     server_address = ('', port)
-    httpd = HTTPServer(server_address, handler)
+    httpd = ThreadingHTTPServer(server_address, handler)
 
     print(f"Starting ROKO data server on port {port}")
     print(f"Serving directory: {os.getcwd()}")
@@ -3,15 +3,43 @@ Configuration settings and management for the ROKO token data extractor.
 """
 
 import os
+import re
+import copy
 import yaml
-from typing import Dict, Any, List
+from functools import lru_cache
+from string import Template
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 
+# Use libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Matches ${VAR} environment references and the {API_KEY} URL placeholder
+_VAR_RE = re.compile(r'\$\{(\w+)\}|\{API_KEY\}')
+
+
+@lru_cache(maxsize=8)
+def _parse_config(content: str) -> Dict[str, Any]:
+    """Parse expanded YAML config text, reusing the result for identical content."""
+    return yaml.load(content, Loader=SafeLoader)
+
 
 class Config:
     """Configuration manager for the ROKO token data extractor."""
     
+    __slots__ = (
+        'config_path', '_config', '_rpc_providers',
+        '_ethereum', '_token', '_stablecoins', '_monitoring', '_pools', '_contracts',
+        'token_address', 'token_name', 'token_symbol', 'token_decimals', 'treasury_wallets',
+        'usdc_address', 'usdt_address', 'weth_address',
+        'uniswap_v2_factory', 'uniswap_v3_factory',
+        'update_interval', 'log_level', 'export_formats',
+    )
+    
     def __init__(self, config_path: str = "config/config.yaml"):
         """Initialize configuration from YAML file."""
         self.config_path = Path(config_path)
@@ -22,6 +50,38 @@ class Config:
             load_dotenv(env_file)
         
         self._config = self._load_config()
+        self._rpc_providers = None
+        self._resolve_settings()
+    
+    def _resolve_settings(self) -> None:
+        """Resolve configuration sections and typed settings once, applying defaults."""
+        self._ethereum = self._config.get('ethereum', {})
+        self._token = self._config.get('token', {})
+        self._stablecoins = self._config.get('stablecoins', {})
+        self._monitoring = self._config.get('monitoring', {})
+        self._pools = self._config.get('pools', {})
+        self._contracts = self._config.get('contracts', {})
+        
+        self.token_address = self._token.get('address', '0x6f222e04f6c53cc688ffb0abe7206aac66a8ff98')
+        self.token_name = self._token.get('name', 'ROKO')
+        self.token_symbol = self._token.get('symbol', 'ROKO')
+        self.token_decimals = self._token.get('decimals', 18)
+        
+        # Split treasury wallets by comma and clean up whitespace
+        treasury_wallets_str = self._token.get('treasury_wallets', '') or ''
+        self.treasury_wallets = [wallet.strip() for wallet in treasury_wallets_str.split(',') if wallet.strip()]
+        
+        self.usdc_address = self._stablecoins.get('usdc_address', '0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48')
+        self.usdt_address = self._stablecoins.get('usdt_address', '0xdAC17F958D2ee523a2206206994597C13D831ec7')
+        self.weth_address = self._stablecoins.get('weth_address', '0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2')
+        
+        self.uniswap_v2_factory = self._pools.get('uniswap_v2_factory', '0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f')
+        self.uniswap_v3_factory = self._pools.get('uniswap_v3_factory', '0x1F98431c8aD98523631AE4a59f267346ea31F984')
+        
+        self.update_interval = self._monitoring.get('update_interval', 30)
+        self.log_level = self._monitoring.get('log_level', 'INFO')
+        self.export_formats = self._monitoring.get('export_format', ['json', 'csv'])
+        self.analytics_state_dir = self._monitoring.get('analytics_state_dir')
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from YAML file with environment variable expansion."""
@@ -29,11 +89,11 @@ class Config:
             with open(self.config_path, 'r') as file:
                 content = file.read()
             
-            # Expand environment variables
-            content = os.path.expandvars(content)
+            # Expand $VAR / ${VAR} environment variables, leaving unknown ones as-is
+            content = Template(content).safe_substitute(os.environ)
             
-            config = yaml.safe_load(content)
-            return config
+            # Callers may modify their config, so hand each one its own copy
+            return copy.deepcopy(_parse_config(content))
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         except yaml.YAMLError as e:
@@ -42,32 +102,37 @@ class Config:
     @property
     def ethereum(self) -> Dict[str, Any]:
         """Get Ethereum configuration."""
-        return self._config.get('ethereum', {})
+        return self._ethereum
     
     @property
     def token(self) -> Dict[str, Any]:
         """Get token configuration."""
-        return self._config.get('token', {})
+        return self._token
     
     @property
     def stablecoins(self) -> Dict[str, Any]:
         """Get stablecoins configuration."""
-        return self._config.get('stablecoins', {})
+        return self._stablecoins
     
     @property
     def monitoring(self) -> Dict[str, Any]:
         """Get monitoring configuration."""
-        return self._config.get('monitoring', {})
+        return self._monitoring
     
     @property
     def pools(self) -> Dict[str, Any]:
         """Get pools configuration."""
-        return self._config.get('pools', {})
+        return self._pools
     
     @property
     def contracts(self) -> Dict[str, Any]:
         """Get contracts configuration."""
-        return self._config.get('contracts', {})
+        return self._contracts
+    
+    @property
+    def roko_token(self) -> Dict[str, Any]:
+        """Get token configuration (alias of ``token`` for older callers)."""
+        return self._token
     
     def get_rpc_url(self) -> str:
         """Get the RPC URL with API key substitution (legacy mode)."""
@@ -84,26 +149,32 @@ class Config:
     
     def get_rpc_providers(self) -> List[Dict[str, Any]]:
         """Get the list of RPC providers for load balancing."""
-        providers = self.ethereum.get('rpc_providers', [])
+        if self._rpc_providers is None:
+            self._rpc_providers = [
+                self._resolve_provider(provider)
+                for provider in self.ethereum.get('rpc_providers', [])
+            ]
+        return self._rpc_providers
+    
+    @staticmethod
+    def _resolve_provider(provider: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resolve ${VAR} references and the {API_KEY} placeholder for one provider.
         
-        # Process API key substitution for each provider
-        for provider in providers:
-            # Handle API key substitution
-            api_key_var = provider.get('api_key', '')
-            if api_key_var.startswith('${') and api_key_var.endswith('}'):
-                env_var = api_key_var[2:-1]  # Remove ${ and }
-                api_key = os.getenv(env_var, '')
-                provider['api_key'] = api_key
+        Args:
+            provider: Provider entry from the configuration
             
-            # Handle URL API key substitution
-            if '{API_KEY}' in provider.get('url', ''):
-                if provider.get('api_key'):
-                    provider['url'] = provider['url'].replace('{API_KEY}', provider['api_key'])
-                else:
-                    # If no API key, remove the placeholder
-                    provider['url'] = provider['url'].replace('{API_KEY}', '')
-        
-        return providers
+        Returns:
+            New provider dictionary with the API key and URL substituted
+        """
+        resolved = dict(provider)
+        api_key = _VAR_RE.sub(lambda m: os.getenv(m.group(1), '') if m.group(1) else '', provider.get('api_key', ''))
+        if 'api_key' in provider:
+            resolved['api_key'] = api_key
+        if 'url' in provider:
+            # If no API key, the placeholder is removed
+            resolved['url'] = _VAR_RE.sub(lambda m: os.getenv(m.group(1), '') if m.group(1) else api_key, provider['url'])
+        return resolved
     
     def get_load_balancing_config(self) -> Dict[str, Any]:
         """Get load balancing configuration."""
@@ -111,57 +182,61 @@ class Config:
     
     def get_token_address(self) -> str:
         """Get the token contract address."""
-        return self.token.get('address', '0x6f222e04f6c53cc688ffb0abe7206aac66a8ff98')
+        return self.token_address
+    
+    def get_roko_address(self) -> str:
+        """Get the ROKO token contract address (alias of ``get_token_address``)."""
+        return self.token_address
     
     def get_token_name(self) -> str:
         """Get the token name."""
-        return self.token.get('name', 'ROKO')
+        return self.token_name
     
     def get_token_symbol(self) -> str:
         """Get the token symbol."""
-        return self.token.get('symbol', 'ROKO')
+        return self.token_symbol
     
     def get_token_decimals(self) -> int:
         """Get the token decimals."""
-        return self.token.get('decimals', 18)
+        return self.token_decimals
     
     def get_treasury_wallets(self) -> List[str]:
         """Get the list of treasury wallets to exclude from circulating supply."""
-        treasury_wallets_str = self.token.get('treasury_wallets', '')
-        if treasury_wallets_str:
-            # Split by comma and clean up whitespace
-            return [wallet.strip() for wallet in treasury_wallets_str.split(',') if wallet.strip()]
-        return []
+        return list(self.treasury_wallets)
     
     def get_usdc_address(self) -> str:
         """Get the USDC contract address."""
-        return self.stablecoins.get('usdc_address', '0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48')
+        return self.usdc_address
     
     def get_usdt_address(self) -> str:
         """Get the USDT contract address."""
-        return self.stablecoins.get('usdt_address', '0xdAC17F958D2ee523a2206206994597C13D831ec7')
+        return self.usdt_address
     
     def get_weth_address(self) -> str:
         """Get the WETH contract address."""
-        return self.stablecoins.get('weth_address', '0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2')
+        return self.weth_address
     
     def get_uniswap_v2_factory(self) -> str:
         """Get the Uniswap V2 factory address."""
-        return self.pools.get('uniswap_v2_factory', '0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f')
+        return self.uniswap_v2_factory
     
     def get_uniswap_v3_factory(self) -> str:
         """Get the Uniswap V3 factory address."""
-        return self.pools.get('uniswap_v3_factory', '0x1F98431c8aD98523631AE4a59f267346ea31F984')
+        return self.uniswap_v3_factory
     
     def get_update_interval(self) -> int:
         """Get the monitoring update interval in seconds."""
-        return self.monitoring.get('update_interval', 30)
+        return self.update_interval
     
     def get_log_level(self) -> str:
         """Get the logging level."""
-        return self.monitoring.get('log_level', 'INFO')
+        return self.log_level
     
     def get_export_formats(self) -> list:
         """Get the export formats."""
-        return self.monitoring.get('export_format', ['json', 'csv'])
+        return self.export_formats
+    
+    def get_analytics_state_dir(self) -> Optional[str]:
+        """Get the directory for holder scan checkpoints (None disables incremental scans)."""
+        return self.analytics_state_dir
 
@@ -2,28 +2,75 @@
 Advanced analytics module for token holder analysis and exchange interactions.
 """
 
+import heapq
+import json
 import logging
-from typing import Dict, Any, List, Set, Optional, Tuple
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from operator import attrgetter
+from typing import Dict, Any, Iterable, Iterator, List, Set, Optional, Tuple
 from collections import defaultdict, Counter
+from itertools import chain
+from pathlib import Path
 from web3 import Web3
 import time
 
+from .enhanced_rpc_client import LOGS_CACHE_CONFIRMATIONS
+
+
+# Transfer event signature: Transfer(address indexed from, address indexed to, uint256 value)
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def decode_uint256(data: Any) -> int:
+    """
+    Decode a big-endian uint256 from log data.
+
+    Args:
+        data: Log data as raw bytes (HexBytes) or a 0x-prefixed hex string
+
+    Returns:
+        Decoded integer value (0 for empty data)
+    """
+    if isinstance(data, str):
+        hex_data = data[2:] if data.startswith('0x') else data
+        if len(hex_data) % 2:
+            hex_data = '0' + hex_data
+        data = bytes.fromhex(hex_data)
+    return int.from_bytes(data, 'big')
+
+
+@dataclass
+class Holder:
+    """Token holder address and raw balance."""
+    __slots__ = ('address', 'balance')
+    address: str
+    balance: int
+
 
 class TokenAnalytics:
     """Advanced analytics for token holders and exchange interactions."""
     
-    def __init__(self, rpc_client, token_address: str):
+    def __init__(self, rpc_client, token_address: str, state_dir: Optional[str] = None):
         """
         Initialize the analytics module.
         
         Args:
             rpc_client: Ethereum RPC client instance
             token_address: Token contract address
+            state_dir: Directory for holder scan checkpoints (enables incremental scans)
         """
         self.rpc_client = rpc_client
         self.token_address = token_address
         self.logger = logging.getLogger(__name__)
         
+        # Checkpoint of the last holder scan, resumed from on the next default-range scan
+        self.state_file = None
+        if state_dir:
+            self.state_file = Path(state_dir) / f"holders_state_{token_address.lower()}.json"
+        
         # Known exchange contract addresses
         self.exchange_contracts = {
             'uniswap_v2_router': '0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D',
@@ -34,6 +81,14 @@ class TokenAnalytics:
             'zerox_router': '0xDef1C0ded9bec7F1a1670819833240f027b25EfF',
         }
         
+        # Lowercased exchange address -> name, matching the addresses decoded from log topics
+        self._exchange_by_address = {
+            address.lower(): name for name, address in self.exchange_contracts.items()
+        }
+        
+        # Exchange name -> bit, so each user's exchanges fit in one int instead of a set
+        self._exchange_bits = {name: 1 << i for i, name in enumerate(self.exchange_contracts)}
+        
         # DEX factory addresses for pool detection
         self.dex_factories = {
             'uniswap_v2': '0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f',
@@ -46,6 +101,9 @@ class TokenAnalytics:
         """
         Extract token holders from Transfer events.
         
+        When no from_block is given, the scan resumes from the last checkpoint (if a
+        state directory is configured) and only fetches blocks after it.
+        
         Args:
             from_block: Starting block number
             to_block: Ending block number
@@ -55,91 +113,20 @@ class TokenAnalytics:
             Dictionary with holder information
         """
         try:
+            # Only default-range scans read and advance the checkpoint; explicit ranges are one-off
             if from_block is None:
-                # Get events from last 10000 blocks (approximately 1.5 days)
-                latest_block = self.rpc_client.get_latest_block()
-                from_block = max(0, latest_block['number'] - 10000)
+                head = self.rpc_client.get_latest_block()['number']
+                _, to_block = self._resolve_block_range(None, to_block, head)
+                return self._scan_holders_incremental(to_block, head, max_holders)
             
-            self.logger.info(f"Scanning Transfer events from block {from_block} to {to_block}")
-            
-            # Transfer event signature: Transfer(address indexed from, address indexed to, uint256 value)
-            transfer_topic = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+            from_block, to_block = self._resolve_block_range(from_block, to_block)
             
-            # Get Transfer events
-            logs = self.rpc_client.get_logs(
-                from_block=from_block,
-                to_block=to_block,
-                address=self.token_address,
-                topics=[transfer_topic]
-            )
+            self.logger.info(f"Scanning Transfer events from block {from_block} to {to_block}")
             
-            # Process events to build holder balances
             holder_balances = defaultdict(int)
-            total_transfers = 0
-            
-            for log in logs:
-                if len(log['topics']) >= 3:
-                    from_addr = "0x" + log['topics'][1][-40:]  # Extract from address
-                    to_addr = "0x" + log['topics'][2][-40:]    # Extract to address
-                    
-                    # Decode the value from the data field
-                    value_hex = log['data'][2:]  # Remove '0x' prefix
-                    value = int(value_hex, 16) if value_hex else 0
-                    
-                    # Update balances
-                    if from_addr != "0x0000000000000000000000000000000000000000":  # Not a mint
-                        holder_balances[from_addr] -= value
-                    if to_addr != "0x0000000000000000000000000000000000000000":  # Not a burn
-                        holder_balances[to_addr] += value
-                    
-                    total_transfers += 1
-            
-            # Filter out zero balances and sort by balance
-            active_holders = {
-                addr: balance for addr, balance in holder_balances.items() 
-                if balance > 0
-            }
-            
-            # Sort by balance (descending)
-            sorted_holders = sorted(active_holders.items(), key=lambda x: x[1], reverse=True)
-            
-            # Get top holders
-            top_holders = sorted_holders[:max_holders]
+            total_transfers = self._apply_transfers(holder_balances, from_block, to_block)
             
-            # Calculate statistics
-            total_holders = len(active_holders)
-            total_supply = sum(active_holders.values())
-            
-            # Calculate concentration metrics
-            top_10_balance = sum(balance for _, balance in top_holders[:10])
-            top_100_balance = sum(balance for _, balance in top_holders[:100])
-            
-            concentration_10 = (top_10_balance / total_supply * 100) if total_supply > 0 else 0
-            concentration_100 = (top_100_balance / total_supply * 100) if total_supply > 0 else 0
-            
-            return {
-                'total_holders': total_holders,
-                'total_transfers_analyzed': total_transfers,
-                'total_supply_analyzed': total_supply,
-                'top_holders': [
-                    {
-                        'address': addr,
-                        'balance': balance,
-                        'balance_formatted': balance / (10**18),  # Assuming 18 decimals
-                        'percentage': (balance / total_supply * 100) if total_supply > 0 else 0
-                    }
-                    for addr, balance in top_holders
-                ],
-                'concentration_metrics': {
-                    'top_10_percentage': concentration_10,
-                    'top_100_percentage': concentration_100,
-                    'gini_coefficient': self._calculate_gini_coefficient([balance for _, balance in active_holders.values()])
-                },
-                'scan_range': {
-                    'from_block': from_block,
-                    'to_block': to_block
-                }
-            }
+            return self._holder_stats(holder_balances, total_transfers, max_holders, from_block, to_block)
             
         except Exception as e:
             self.logger.error(f"Error getting token holders: {e}")
@@ -157,98 +144,17 @@ class TokenAnalytics:
             Dictionary with exchange interaction data
         """
         try:
-            if from_block is None:
-                latest_block = self.rpc_client.get_latest_block()
-                from_block = max(0, latest_block['number'] - 10000)
+            from_block, to_block = self._resolve_block_range(from_block, to_block)
             
             self.logger.info(f"Analyzing exchange interactions from block {from_block} to {to_block}")
             
-            # Transfer event signature
-            transfer_topic = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
-            
-            # Get Transfer events
-            logs = self.rpc_client.get_logs(
-                from_block=from_block,
-                to_block=to_block,
-                address=self.token_address,
-                topics=[transfer_topic]
-            )
-            
             # Analyze interactions
-            exchange_interactions = defaultdict(list)
-            user_interactions = defaultdict(lambda: {
-                'exchanges_used': set(),
-                'total_volume': 0,
-                'transaction_count': 0
-            })
-            
-            for log in logs:
-                if len(log['topics']) >= 3:
-                    from_addr = "0x" + log['topics'][1][-40:]
-                    to_addr = "0x" + log['topics'][2][-40:]
-                    
-                    # Decode value
-                    value_hex = log['data'][2:]
-                    value = int(value_hex, 16) if value_hex else 0
-                    
-                    # Check if interaction involves exchange contracts
-                    for exchange_name, exchange_addr in self.exchange_contracts.items():
-                        if from_addr.lower() == exchange_addr.lower() or to_addr.lower() == exchange_addr.lower():
-                            exchange_interactions[exchange_name].append({
-                                'block_number': log['block_number'],
-                                'transaction_hash': log['transaction_hash'],
-                                'from': from_addr,
-                                'to': to_addr,
-                                'value': value,
-                                'value_formatted': value / (10**18)
-                            })
-                            
-                            # Track user interactions
-                            user_addr = to_addr if from_addr.lower() == exchange_addr.lower() else from_addr
-                            user_interactions[user_addr]['exchanges_used'].add(exchange_name)
-                            user_interactions[user_addr]['total_volume'] += value
-                            user_interactions[user_addr]['transaction_count'] += 1
+            exchange_totals, user_interactions = self._new_exchange_accumulators()
             
-            # Calculate statistics
-            total_exchange_transactions = sum(len(interactions) for interactions in exchange_interactions.values())
-            unique_users = len(user_interactions)
+            for from_addr, to_addr, value, _ in self._scan_transfers(from_block, to_block):
+                self._record_exchange_transfer(exchange_totals, user_interactions, from_addr, to_addr, value)
             
-            # Get top users by volume
-            top_users = sorted(
-                user_interactions.items(),
-                key=lambda x: x[1]['total_volume'],
-                reverse=True
-            )[:50]
-            
-            return {
-                'total_exchange_transactions': total_exchange_transactions,
-                'unique_users_interacting': unique_users,
-                'exchange_breakdown': {
-                    name: {
-                        'transaction_count': len(interactions),
-                        'total_volume': sum(tx['value'] for tx in interactions),
-                        'total_volume_formatted': sum(tx['value_formatted'] for tx in interactions),
-                        'unique_users': len(set(tx['from'] if tx['from'].lower() != exchange_addr.lower() else tx['to'] 
-                                               for tx in interactions))
-                    }
-                    for name, exchange_addr in self.exchange_contracts.items()
-                    for interactions in [exchange_interactions[name]]
-                },
-                'top_users': [
-                    {
-                        'address': addr,
-                        'exchanges_used': list(data['exchanges_used']),
-                        'total_volume': data['total_volume'],
-                        'total_volume_formatted': data['total_volume'] / (10**18),
-                        'transaction_count': data['transaction_count']
-                    }
-                    for addr, data in top_users
-                ],
-                'scan_range': {
-                    'from_block': from_block,
-                    'to_block': to_block
-                }
-            }
+            return self._exchange_stats(exchange_totals, user_interactions, from_block, to_block)
             
         except Exception as e:
             self.logger.error(f"Error analyzing exchange interactions: {e}")
@@ -299,8 +205,24 @@ class TokenAnalytics:
             self.logger.info("Starting comprehensive analytics analysis")
             
             # Get all analytics data
-            holders_data = self.get_token_holders_from_events(from_block, to_block)
-            exchange_data = self.get_exchange_interactions(from_block, to_block)
+            if from_block is None and self.state_file is not None:
+                # Incremental holder scans cover a different range than the exchange scan; both
+                # end at the same head, read once so a lagging provider can't split them
+                head = self.rpc_client.get_latest_block()['number']
+                from_block, to_block = self._resolve_block_range(None, to_block, head)
+                try:
+                    holders_data = self._scan_holders_incremental(to_block, head, 1000)
+                except Exception as e:
+                    self.logger.error(f"Error getting token holders: {e}")
+                    holders_data = {}
+                exchange_data = self.get_exchange_interactions(from_block, to_block)
+            else:
+                try:
+                    # Fetch and decode the Transfer events once for both analyses
+                    holders_data, exchange_data = self._scan_holders_and_exchanges(from_block, to_block)
+                except Exception as e:
+                    self.logger.error(f"Error scanning holders and exchange interactions: {e}")
+                    holders_data, exchange_data = {}, {}
             liquidity_data = self.get_liquidity_providers(from_block, to_block)
             
             return {
@@ -323,6 +245,317 @@ class TokenAnalytics:
             self.logger.error(f"Error getting comprehensive analytics: {e}")
             return {}
     
+    def _scan_holders_incremental(self, to_block: int, head: int, max_holders: int) -> Dict[str, Any]:
+        """
+        Build holder balances up to to_block, resuming from and advancing the checkpoint.
+        
+        Only blocks at least LOGS_CACHE_CONFIRMATIONS behind head are folded into the
+        saved checkpoint; the unconfirmed tail is rescanned on every run so a reorg can
+        never be baked into the saved balances. The checkpoint never moves backwards.
+        
+        Args:
+            to_block: Ending block number
+            head: Latest block number, read once for the whole run
+            max_holders: Maximum number of holders to return
+            
+        Returns:
+            Dictionary with holder information
+        """
+        checkpoint = self._load_holder_checkpoint()
+        if checkpoint:
+            # Older checkpoints did not record where their balances start
+            first_block = checkpoint.get('first_block')
+            start = checkpoint['last_block'] + 1
+            holder_balances = defaultdict(int, checkpoint['balances'])
+        else:
+            # Get events from last 10000 blocks (approximately 1.5 days) by default
+            first_block = start = max(0, head - 10000)
+            holder_balances = defaultdict(int)
+        
+        if start > to_block:
+            self.logger.warning(f"Block {to_block} is behind the holder checkpoint at block {start - 1}, "
+                                f"reporting the checkpointed balances")
+            return self._holder_stats(holder_balances, 0, max_holders, first_block, start - 1)
+        
+        self.logger.info(f"Scanning Transfer events from block {start} to {to_block}")
+        
+        confirmed_block = min(to_block, head - LOGS_CACHE_CONFIRMATIONS)
+        total_transfers = 0
+        
+        if confirmed_block >= start:
+            total_transfers += self._apply_transfers(holder_balances, start, confirmed_block)
+            self._save_holder_checkpoint(first_block, confirmed_block, holder_balances)
+            start = confirmed_block + 1
+        
+        if start <= to_block:
+            total_transfers += self._apply_transfers(holder_balances, start, to_block)
+        
+        return self._holder_stats(holder_balances, total_transfers, max_holders, first_block, to_block)
+    
+    def _apply_transfers(self, holder_balances: Dict[str, int], from_block: int, to_block: int) -> int:
+        """Fold the Transfer events in a block range into holder balances, returning the transfer count."""
+        total_transfers = 0
+        for from_addr, to_addr, value, _ in self._scan_transfers(from_block, to_block):
+            # Update balances
+            if from_addr != ZERO_ADDRESS:  # Not a mint
+                holder_balances[from_addr] -= value
+            if to_addr != ZERO_ADDRESS:  # Not a burn
+                holder_balances[to_addr] += value
+            
+            total_transfers += 1
+        return total_transfers
+    
+    def _scan_holders_and_exchanges(self, from_block: Optional[int], to_block: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Build holder and exchange analytics from a single pass over the Transfer events.
+        
+        Args:
+            from_block: Starting block number
+            to_block: Ending block number
+            
+        Returns:
+            Tuple of (holder data, exchange interaction data)
+        """
+        from_block, to_block = self._resolve_block_range(from_block, to_block)
+        
+        self.logger.info(f"Scanning Transfer events for holders and exchanges from block {from_block} to {to_block}")
+        
+        holder_balances = defaultdict(int)
+        exchange_totals, user_interactions = self._new_exchange_accumulators()
+        total_transfers = 0
+        
+        for from_addr, to_addr, value, _ in self._scan_transfers(from_block, to_block):
+            if from_addr != ZERO_ADDRESS:  # Not a mint
+                holder_balances[from_addr] -= value
+            if to_addr != ZERO_ADDRESS:  # Not a burn
+                holder_balances[to_addr] += value
+            total_transfers += 1
+            
+            self._record_exchange_transfer(exchange_totals, user_interactions, from_addr, to_addr, value)
+        
+        return (
+            self._holder_stats(holder_balances, total_transfers, 1000, from_block, to_block),
+            self._exchange_stats(exchange_totals, user_interactions, from_block, to_block)
+        )
+    
+    def _scan_transfers(self, from_block: int, to_block: int) -> Iterator[Tuple[str, str, int, Dict[str, Any]]]:
+        """Stream decoded Transfer events for the token, fetching block sub-ranges concurrently and in order."""
+        logs = chain.from_iterable(self.rpc_client.iter_logs_parallel(
+            from_block=from_block,
+            to_block=to_block,
+            address=self.token_address,
+            topics=[TRANSFER_TOPIC]
+        ))
+        return self._decode_transfers(logs)
+    
+    def _holder_stats(self, holder_balances: Dict[str, int], total_transfers: int, max_holders: int,
+                      from_block: int, to_block: int) -> Dict[str, Any]:
+        """Summarize accumulated holder balances into top holders and concentration metrics."""
+        # Filter out zero balances; only the balances themselves are kept for the statistics
+        active_balances = [balance for balance in holder_balances.values() if balance > 0]
+        
+        # Get top holders by balance (descending) without sorting or copying every holder
+        top_holders = heapq.nlargest(
+            max_holders,
+            (Holder(addr, balance) for addr, balance in holder_balances.items() if balance > 0),
+            key=attrgetter('balance')
+        )
+        
+        # Calculate statistics
+        total_holders = len(active_balances)
+        total_supply = sum(active_balances)
+        
+        # Calculate concentration metrics
+        top_10_balance = sum(holder.balance for holder in top_holders[:10])
+        top_100_balance = sum(holder.balance for holder in top_holders[:100])
+        
+        concentration_10 = (top_10_balance / total_supply * 100) if total_supply > 0 else 0
+        concentration_100 = (top_100_balance / total_supply * 100) if total_supply > 0 else 0
+        
+        return {
+            'total_holders': total_holders,
+            'total_transfers_analyzed': total_transfers,
+            'total_supply_analyzed': total_supply,
+            'top_holders': [
+                {
+                    **asdict(holder),
+                    'balance_formatted': holder.balance / (10**18),  # Assuming 18 decimals
+                    'percentage': (holder.balance / total_supply * 100) if total_supply > 0 else 0
+                }
+                for holder in top_holders
+            ],
+            'concentration_metrics': {
+                'top_10_percentage': concentration_10,
+                'top_100_percentage': concentration_100,
+                'gini_coefficient': self._calculate_gini_coefficient(active_balances)
+            },
+            'scan_range': {
+                'from_block': from_block,
+                'to_block': to_block
+            }
+        }
+    
+    def _new_exchange_accumulators(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """Create empty per-exchange and per-user accumulators for exchange analysis."""
+        exchange_totals = defaultdict(lambda: {
+            'transaction_count': 0,
+            'total_volume': 0,
+            'users': set()
+        })
+        user_interactions = defaultdict(lambda: {
+            'exchanges_used': 0,
+            'total_volume': 0,
+            'transaction_count': 0
+        })
+        return exchange_totals, user_interactions
+    
+    def _record_exchange_transfer(self, exchange_totals: Dict[str, Dict[str, Any]],
+                                  user_interactions: Dict[str, Dict[str, Any]],
+                                  from_addr: str, to_addr: str, value: int):
+        """Record a transfer against any exchange contract it touches."""
+        from_exchange = self._exchange_by_address.get(from_addr)
+        to_exchange = self._exchange_by_address.get(to_addr)
+        
+        if from_exchange:
+            self._record_exchange_interaction(exchange_totals, user_interactions, from_exchange, to_addr, value)
+        if to_exchange and to_exchange != from_exchange:
+            self._record_exchange_interaction(exchange_totals, user_interactions, to_exchange, from_addr, value)
+    
+    def _record_exchange_interaction(self, exchange_totals: Dict[str, Dict[str, Any]],
+                                     user_interactions: Dict[str, Dict[str, Any]], exchange_name: str,
+                                     user_addr: str, value: int):
+        """Add one exchange transfer to the exchange's running totals and credit the user on the other side."""
+        totals = exchange_totals[exchange_name]
+        totals['transaction_count'] += 1
+        totals['total_volume'] += value
+        totals['users'].add(user_addr)
+        
+        # Track user interactions
+        user = user_interactions[user_addr]
+        user['exchanges_used'] |= self._exchange_bits[exchange_name]
+        user['total_volume'] += value
+        user['transaction_count'] += 1
+    
+    def _exchange_stats(self, exchange_totals: Dict[str, Dict[str, Any]],
+                        user_interactions: Dict[str, Dict[str, Any]],
+                        from_block: int, to_block: int) -> Dict[str, Any]:
+        """Summarize the running exchange totals into per-exchange breakdowns and top users."""
+        # Calculate statistics
+        total_exchange_transactions = sum(totals['transaction_count'] for totals in exchange_totals.values())
+        unique_users = len(user_interactions)
+        
+        exchange_breakdown = {}
+        for name in self.exchange_contracts:
+            totals = exchange_totals.get(name)
+            total_volume = totals['total_volume'] if totals else 0
+            exchange_breakdown[name] = {
+                'transaction_count': totals['transaction_count'] if totals else 0,
+                'total_volume': total_volume,
+                'total_volume_formatted': total_volume / (10**18),
+                'unique_users': len(totals['users']) if totals else 0
+            }
+        
+        # Get top users by volume (bounded heap instead of sorting every user)
+        top_users = heapq.nlargest(
+            50,
+            user_interactions.items(),
+            key=lambda x: x[1]['total_volume']
+        )
+        
+        return {
+            'total_exchange_transactions': total_exchange_transactions,
+            'unique_users_interacting': unique_users,
+            'exchange_breakdown': exchange_breakdown,
+            'top_users': [
+                {
+                    'address': addr,
+                    'exchanges_used': [
+                        name for name, bit in self._exchange_bits.items() if data['exchanges_used'] & bit
+                    ],
+                    'total_volume': data['total_volume'],
+                    'total_volume_formatted': data['total_volume'] / (10**18),
+                    'transaction_count': data['transaction_count']
+                }
+                for addr, data in top_users
+            ],
+            'scan_range': {
+                'from_block': from_block,
+                'to_block': to_block
+            }
+        }
+    
+    def _decode_transfers(self, logs: Iterable[Dict[str, Any]]) -> Iterator[Tuple[str, str, int, Dict[str, Any]]]:
+        """
+        Decode Transfer logs in a single pass.
+        
+        Args:
+            logs: Formatted Transfer logs from the RPC client
+            
+        Yields:
+            Tuples of (from address, to address, value, log)
+        """
+        decode = decode_uint256
+        for log in logs:
+            topics = log['topics']
+            if len(topics) >= 3:
+                yield "0x" + topics[1][-40:], "0x" + topics[2][-40:], decode(log['data']), log
+    
+    def _resolve_block_range(self, from_block: Optional[int], to_block: Any,
+                             head: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Resolve a scan range to concrete block numbers.
+        
+        Pinning 'latest' to a block number makes the range immutable, so the
+        RPC client can cache the resulting logs. A head already read by the
+        caller is reused instead of asking the provider again.
+        """
+        if from_block is None or to_block == 'latest':
+            latest_number = head if head is not None else self.rpc_client.get_latest_block()['number']
+            if to_block == 'latest':
+                to_block = latest_number
+            if from_block is None:
+                from_block = max(0, latest_number - 10000)
+        return from_block, to_block
+    
+    def _load_holder_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Load the last holder scan checkpoint, if one exists."""
+        if not self.state_file or not self.state_file.exists():
+            return None
+        
+        try:
+            with open(self.state_file, 'r') as f:
+                checkpoint = json.load(f)
+            self.logger.info(f"Resuming holder scan from checkpoint at block {checkpoint['last_block']}")
+            return checkpoint
+        except (json.JSONDecodeError, KeyError, OSError) as e:
+            self.logger.warning(f"Ignoring unreadable holder checkpoint {self.state_file}: {e}")
+            return None
+    
+    def _save_holder_checkpoint(self, first_block: Optional[int], last_block: int, balances: Dict[str, int]):
+        """Persist the scanned block range and running balances for the next incremental scan."""
+        if not self.state_file:
+            return
+        
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            checkpoint = {
+                'first_block': first_block,
+                'last_block': last_block,
+                'balances': {addr: balance for addr, balance in balances.items() if balance != 0}
+            }
+            # Write to a private temporary file first so an interrupted run, or another run saving
+            # at the same time, never leaves a partial or interleaved checkpoint
+            fd, tmp_path = tempfile.mkstemp(dir=self.state_file.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(checkpoint, f)
+                os.replace(tmp_path, self.state_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            self.logger.warning(f"Could not save holder checkpoint: {e}")
+    
     def _calculate_gini_coefficient(self, values: List[int]) -> float:
         """Calculate Gini coefficient for wealth distribution analysis."""
         if not values:
@@ -330,16 +563,10 @@ class TokenAnalytics:
         
         values = sorted(values)
         n = len(values)
-        cumsum = [0] + list(accumulate(values))
+        total = sum(values)
+        if total == 0:
+            return 0.0
         
-        return (n + 1 - 2 * sum((n + 1 - i) * y for i, y in enumerate(cumsum[1:], 1))) / (n * sum(values))
-
-
-def accumulate(iterable):
-    """Accumulate function for Gini coefficient calculation."""
-    it = iter(iterable)
-    total = next(it)
-    yield total
-    for element in it:
-        total += element
-        yield total
+        # G = sum((2i - n - 1) * x_i) / (n * sum(x)) over ascending x_i, i = 1..n
+        weighted = sum((2 * i - n - 1) * value for i, value in enumerate(values, 1))
+        return weighted / (n * total)
@@ -4,8 +4,13 @@ Enhanced Ethereum RPC client with load balancing and failover support.
 
 import os
 import json
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
 
 from web3 import Web3
 from web3.exceptions import ContractLogicError
@@ -14,8 +19,29 @@ from hexbytes import HexBytes
 
 from config.settings import Config
 from utils.data_processor import DataProcessor
+from utils.logs_cache import LogsCache
 from core.rpc_load_balancer import RPCLoadBalancer
 
+# Function selector for ERC20 balanceOf(address)
+BALANCE_OF_SELECTOR = "0x70a08231"
+
+# Function selectors for the ERC20 metadata returned by get_token_info
+TOKEN_INFO_SELECTORS = {
+    'name': "0x06fdde03",
+    'symbol': "0x95d89b41",
+    'decimals': "0x313ce567",
+    'total_supply': "0x18160ddd",
+}
+
+@lru_cache(maxsize=131072)
+def _checksum_address(address: str) -> ChecksumAddress:
+    """Convert a lowercased address to its checksum form, memoizing the keccak work."""
+    return Web3.to_checksum_address(address)
+
+
+# Blocks behind head after which a log range is treated as final and persisted
+LOGS_CACHE_CONFIRMATIONS = 64
+
 
 class EnhancedEthereumRPCClient:
     """Enhanced Ethereum RPC client with load balancing and failover support."""
@@ -31,6 +57,21 @@ class EnhancedEthereumRPCClient:
         self.logger = logging.getLogger(self.__class__.__name__)
         self.settings = Config()
         
+        # Single HTTP session for every RPC call (keeps TLS connections alive)
+        self.session = RPCLoadBalancer.create_session()
+        
+        # Contract objects by (web3, address, abi); building one re-parses the ABI
+        self._contracts: Dict[tuple, tuple] = {}
+        self._contracts_size = 256
+        
+        # On-disk cache of finalized log ranges, shared across runs
+        self._logs_disk_cache = LogsCache()
+        self._latest_block_number = None
+        
+        # Requests currently in flight, so concurrent duplicates share one RPC call
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+        
         if use_load_balancer:
             # Get RPC providers from ChainList
             from utils.rpc_fetcher import RPCFetcher
@@ -75,7 +116,7 @@ class EnhancedEthereumRPCClient:
                     load_balancing_config['strategy'] = 'priority'
                     self.logger.info("Alchemy API key detected - using priority strategy for Alchemy-first load balancing")
                 
-                self.load_balancer = RPCLoadBalancer(provider_configs, load_balancing_config)
+                self.load_balancer = RPCLoadBalancer(provider_configs, load_balancing_config, session=self.session)
                 self.web3 = None  # Will be created per request
                 self.logger.info(f"Initialized RPC Load Balancer with {len(provider_configs)} providers")
                 self.logger.info(f"Strategy: {load_balancing_config.get('strategy', 'round_robin')}")
@@ -88,7 +129,7 @@ class EnhancedEthereumRPCClient:
                 rpc_url = self.settings.get_rpc_url()
             
             self.load_balancer = None
-            self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+            self.web3 = Web3(Web3.HTTPProvider(rpc_url, session=self.session))
             if not self.web3.is_connected():
                 raise ConnectionError("Failed to connect to Ethereum node")
             self.logger.info(f"Connected to Ethereum node: {rpc_url}")
@@ -107,19 +148,33 @@ class EnhancedEthereumRPCClient:
         
         try:
             if self.load_balancer:
-                return self.load_balancer.execute_request(_get_latest_block)
+                block = self.load_balancer.execute_request(_get_latest_block)
             else:
-                return _get_latest_block(self.web3)
+                block = _get_latest_block(self.web3)
         except Exception as e:
             self.logger.error(f"Error getting latest block: {e}")
             raise
+        
+        # Remember the head so get_logs can tell which ranges are final
+        self._latest_block_number = block['number']
+        return block
     
     def get_contract_instance(self, address: str, abi: List[Dict[str, Any]], web3: Web3 = None):
-        """Get a contract instance."""
+        """Get a contract instance, reusing one already built for the same Web3 instance and ABI."""
         if web3 is None:
             web3 = self.web3
-        checksum_address = self._to_checksum_address(address, web3)
-        return web3.eth.contract(address=checksum_address, abi=abi)
+        address = address.lower()
+        key = (id(web3), address, id(abi))
+        cached = self._contracts.get(key)
+        # Ids can be reused once an object is freed, so confirm the cached entry is for these objects
+        if cached and cached[0] is web3 and cached[1] is abi:
+            return cached[2]
+        
+        contract = web3.eth.contract(address=_checksum_address(address), abi=abi)
+        if len(self._contracts) >= self._contracts_size:
+            self._contracts.clear()
+        self._contracts[key] = (web3, abi, contract)
+        return contract
     
     def call_contract_method(self, contract_address: str, abi: List[Dict[str, Any]], method_name: str, *args: Any, **kwargs: Any) -> Any:
         """Call a contract method."""
@@ -147,18 +202,101 @@ class EnhancedEthereumRPCClient:
         def _get_token_balance(web3, token_address, wallet_address):
             token_abi = self.settings.contracts.get('erc20_abi', [])
             contract = self.get_contract_instance(token_address, token_abi, web3)
-            checksum_wallet_address = self._to_checksum_address(wallet_address, web3)
+            checksum_wallet_address = _checksum_address(wallet_address.lower())
             return contract.functions.balanceOf(checksum_wallet_address).call()
         
         try:
-            if self.load_balancer:
-                return self.load_balancer.execute_request(_get_token_balance, token_address, wallet_address)
-            else:
-                return _get_token_balance(self.web3, token_address, wallet_address)
+            key = self._get_cache_key('balanceOf', token_address.lower(), wallet_address.lower())
+            return self._coalesce(key, _get_token_balance, token_address, wallet_address)
         except Exception as e:
             self.logger.error(f"Error getting token balance: {e}")
             raise
     
+    def get_token_balances(self, token_address: str, wallet_addresses: List[str], batch_size: int = 500) -> Dict[str, int]:
+        """
+        Get token balances for many wallets using JSON-RPC batch requests.
+        
+        Each batch sends up to ``batch_size`` ``balanceOf`` calls in a single HTTP POST,
+        and batches are dispatched concurrently. Calls that fail, individually or because their whole
+        batch failed, are re-queued for the next round; balances fetched by other batches are kept.
+        
+        Args:
+            token_address: Token contract address
+            wallet_addresses: Wallet addresses to query
+            batch_size: Number of calls per HTTP request
+            
+        Returns:
+            Dictionary mapping wallet address to raw token balance
+        """
+        def _get_token_balances(web3, token_address, wallet_addresses):
+            payload = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "eth_call",
+                    "params": [{"to": token_address, "data": call_data}, "latest"]
+                }
+                for i, call_data in enumerate(call_data_by_address[address] for address in wallet_addresses)
+            ]
+            response = self.session.post(web3.provider.endpoint_uri, json=payload, timeout=30)
+            response.raise_for_status()
+            results = response.json()
+            if not isinstance(results, list):
+                # Provider rejected the batch as a whole (e.g. batching unsupported)
+                raise ValueError(f"Invalid batch response: {results}")
+            
+            balances = {}
+            for item in results:
+                result = item.get('result')
+                if result is not None:
+                    balances[wallet_addresses[item['id']]] = int(result, 16) if result != '0x' else 0
+            return balances
+        
+        def _fetch_chunk(chunk):
+            if self.load_balancer:
+                return self.load_balancer.execute_request(_get_token_balances, token_address, chunk)
+            return _get_token_balances(self.web3, token_address, chunk)
+        
+        # Batches are I/O bound, so dispatch several of them concurrently
+        max_workers = self.load_balancer.max_concurrent_requests if self.load_balancer else 4
+        
+        balances = {}
+        pending = list(dict.fromkeys(wallet_addresses))
+        
+        # Build calldata once per address; retried addresses reuse it
+        call_data_by_address = {
+            address: BALANCE_OF_SELECTOR + address[2:].lower().rjust(64, '0')
+            for address in pending
+        }
+        
+        for attempt in range(3):
+            if not pending:
+                break
+            
+            chunks = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+            failed = []
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                futures = [executor.submit(_fetch_chunk, chunk) for chunk in chunks]
+                for chunk, future in zip(chunks, futures):
+                    try:
+                        chunk_balances = future.result()
+                    except Exception as e:
+                        # Re-queue the whole batch; the other batches' balances are kept
+                        self.logger.error(f"Error getting token balances batch: {e}")
+                        failed.extend(chunk)
+                        continue
+                    balances.update(chunk_balances)
+                    failed.extend(address for address in chunk if address not in chunk_balances)
+            
+            if failed and attempt < 2:
+                self.logger.warning(f"{len(failed)} balance calls failed in batch, retrying")
+            pending = failed
+        
+        if pending:
+            self.logger.warning(f"Could not get balances for {len(pending)} wallets")
+        
+        return balances
+    
     def get_token_supply(self, token_address: str) -> int:
         """Get total supply of a token."""
         def _get_token_supply(web3, token_address):
@@ -179,7 +317,7 @@ class EnhancedEthereumRPCClient:
         """Get logs for a given address and topics."""
         def _get_logs(web3, address, topics, from_block, to_block):
             filter_params = {
-                "address": self._to_checksum_address(address, web3),
+                "address": _checksum_address(address.lower()),
                 "fromBlock": from_block,
                 "toBlock": to_block,
             }
@@ -189,25 +327,170 @@ class EnhancedEthereumRPCClient:
             logs = web3.eth.get_logs(filter_params)
             return [self._format_log(log) for log in logs]
         
+        key = self._get_cache_key('eth_getLogs', address.lower(), topics, from_block, to_block)
+        
+        # Only ranges pinned to concrete block numbers are cacheable
+        cacheable = isinstance(from_block, int) and isinstance(to_block, int)
+        if cacheable:
+            cached = self._logs_disk_cache.get(key)
+            if cached is not None:
+                return cached
+        
         try:
-            if self.load_balancer:
-                return self.load_balancer.execute_request(_get_logs, address, topics, from_block, to_block)
-            else:
-                return _get_logs(self.web3, address, topics, from_block, to_block)
+            logs = self._coalesce(key, _get_logs, address, topics, from_block, to_block)
         except Exception as e:
             if "BadResponse" in str(type(e)):
                 self.logger.error(f"Error getting logs: {e}")
             else:
                 self.logger.error(f"Error getting logs: {e}")
             raise
+        
+        # Persist only ranges deep enough behind head that a reorg cannot change them
+        head = self._latest_block_number
+        if cacheable and head is not None and to_block <= head - LOGS_CACHE_CONFIRMATIONS:
+            self._logs_disk_cache.put(key, logs)
+        
+        return list(logs)
     
-    def _to_checksum_address(self, address: str, web3: Web3 = None) -> ChecksumAddress:
-        """Convert address to checksum address."""
-        if web3 is None:
-            web3 = self.web3
-        if not web3.is_checksum_address(address):
-            return web3.to_checksum_address(address)
-        return ChecksumAddress(address)
+    def iter_logs(self, address: str, topics: Optional[List[str]] = None, from_block: int = 0, to_block: int = None,
+                  initial_chunk: int = 1000, max_chunk: int = 10000, min_chunk: int = 50) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield logs for a block range in adaptively sized chunks.
+        
+        The chunk size grows (doubles) after each successful request and is halved
+        after a failure, so large ranges use few requests on healthy providers while
+        oversized or slow queries shrink until they succeed. Each chunk is yielded as
+        soon as it arrives so callers can fold it without holding the whole range.
+        
+        Args:
+            address: Contract address
+            topics: Log topics filter
+            from_block: First block of the range
+            to_block: Last block of the range (defaults to the latest block)
+            initial_chunk: Initial number of blocks per request
+            max_chunk: Upper bound on blocks per request
+            min_chunk: Lower bound on blocks per request; failing at this size raises
+            
+        Yields:
+            Lists of formatted logs, in block order
+        """
+        if to_block is None or to_block == 'latest':
+            to_block = self.get_latest_block()['number']
+        
+        chunk = initial_chunk
+        start = from_block
+        
+        while start <= to_block:
+            end = min(start + chunk - 1, to_block)
+            try:
+                logs = self.get_logs(address=address, topics=topics, from_block=start, to_block=end)
+            except Exception:
+                if chunk <= min_chunk:
+                    raise
+                chunk = max(min_chunk, chunk // 2)
+                self.logger.info(f"Reducing log scan chunk to {chunk} blocks")
+                continue
+            
+            yield logs
+            start = end + 1
+            chunk = min(max_chunk, chunk * 2)
+    
+    def iter_logs_parallel(self, address: str, topics: Optional[List[str]] = None, from_block: int = 0,
+                           to_block: int = None, chunk_size: int = 2000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield logs for a block range, fetching fixed-size sub-ranges concurrently.
+        
+        Sub-ranges are dispatched through a thread pool (spreading them across the
+        load balancer's providers) with a bounded number in flight, and yielded in
+        block order. A sub-range that fails is split adaptively via scan_logs.
+        
+        Args:
+            address: Contract address
+            topics: Log topics filter
+            from_block: First block of the range
+            to_block: Last block of the range (defaults to the latest block)
+            chunk_size: Number of blocks per sub-range
+            
+        Yields:
+            Lists of formatted logs, in block order
+        """
+        if to_block is None or to_block == 'latest':
+            to_block = self.get_latest_block()['number']
+        
+        ranges = iter([(start, min(start + chunk_size - 1, to_block))
+                       for start in range(from_block, to_block + 1, chunk_size)])
+        
+        def _fetch_range(block_range):
+            start, end = block_range
+            return self.scan_logs(address, topics, start, end,
+                                  initial_chunk=chunk_size, max_chunk=chunk_size)
+        
+        max_workers = self.load_balancer.max_concurrent_requests if self.load_balancer else 4
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Keep at most max_workers sub-ranges in flight so memory stays bounded
+            in_flight = deque()
+            for block_range in ranges:
+                in_flight.append(executor.submit(_fetch_range, block_range))
+                if len(in_flight) >= max_workers:
+                    break
+            
+            while in_flight:
+                logs = in_flight.popleft().result()
+                next_range = next(ranges, None)
+                if next_range is not None:
+                    in_flight.append(executor.submit(_fetch_range, next_range))
+                yield logs
+    
+    def scan_logs(self, address: str, topics: Optional[List[str]] = None, from_block: int = 0, to_block: int = None,
+                  **kwargs: Any) -> List[Dict[str, Any]]:
+        """Get all logs for a block range, fetched in adaptively sized chunks (see iter_logs)."""
+        logs = []
+        for chunk_logs in self.iter_logs(address, topics, from_block, to_block, **kwargs):
+            logs.extend(chunk_logs)
+        return list(logs)
+    
+    def _coalesce(self, key: str, request_func, *args: Any) -> Any:
+        """
+        Execute a request, sharing the result with identical requests already in flight.
+        
+        Args:
+            key: Cache key identifying the request (method and parameters)
+            request_func: Function to execute (should accept web3 instance as first arg)
+            *args: Arguments to pass to request_func
+            
+        Returns:
+            Result of request_func execution
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+        
+        if not is_owner:
+            return future.result()
+        
+        try:
+            if self.load_balancer:
+                result = self.load_balancer.execute_request(request_func, *args)
+            else:
+                result = request_func(self.web3, *args)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    @staticmethod
+    def _get_cache_key(method: str, *params: Any) -> str:
+        """Build a stable cache key from a method name and its parameters."""
+        canonical = json.dumps([method, params], sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
     
     def _format_log(self, log: Dict[str, Any]) -> Dict[str, Any]:
         """Format log entry to be more readable."""
@@ -223,6 +506,12 @@ class EnhancedEthereumRPCClient:
     def get_token_info(self, token_address: str) -> Dict[str, Any]:
         """Get token information (name, symbol, decimals, total supply)."""
         def _get_token_info(web3, token_address):
+            try:
+                # One JSON-RPC batch instead of four sequential eth_calls
+                return self._get_token_info_batched(web3, token_address)
+            except Exception as e:
+                self.logger.debug(f"Batched token info failed, using individual calls: {e}")
+            
             token_abi = self.settings.contracts.get('erc20_abi', [])
             contract = self.get_contract_instance(token_address, token_abi, web3)
             
@@ -247,6 +536,45 @@ class EnhancedEthereumRPCClient:
             self.logger.error(f"Error getting token info: {e}")
             raise
     
+    def _get_token_info_batched(self, web3: Web3, token_address: str) -> Dict[str, Any]:
+        """
+        Fetch ERC20 name, symbol, decimals and total supply in a single JSON-RPC batch.
+        
+        Args:
+            web3: Web3 instance whose provider endpoint receives the batch
+            token_address: Token contract address
+            
+        Returns:
+            Dictionary with name, symbol, decimals and total_supply
+        """
+        fields = list(TOKEN_INFO_SELECTORS)
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "eth_call",
+                "params": [{"to": token_address, "data": TOKEN_INFO_SELECTORS[field]}, "latest"]
+            }
+            for i, field in enumerate(fields)
+        ]
+        response = self.session.post(web3.provider.endpoint_uri, json=payload, timeout=30)
+        response.raise_for_status()
+        results = response.json()
+        if not isinstance(results, list):
+            raise ValueError(f"Invalid batch response: {results}")
+        
+        results_by_id = {item.get('id'): item.get('result') for item in results}
+        raw = {field: results_by_id.get(i) for i, field in enumerate(fields)}
+        if any(result in (None, '0x') for result in raw.values()):
+            raise ValueError(f"Incomplete batch response: {results}")
+        
+        return {
+            'name': web3.codec.decode(['string'], HexBytes(raw['name']))[0],
+            'symbol': web3.codec.decode(['string'], HexBytes(raw['symbol']))[0],
+            'decimals': int(raw['decimals'], 16),
+            'total_supply': int(raw['total_supply'], 16)
+        }
+    
     def get_eth_price_usd(self) -> float:
         """Get current ETH price in USD using price oracle."""
         try:
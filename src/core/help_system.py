@@ -2,249 +2,372 @@
 Comprehensive help system for ROKO Token Data Extractor
 """
 
-import json
-from typing import Dict, Any, List
-
-
-class HelpSystem:
-    """Comprehensive help system with examples and documentation."""
-    
-    def __init__(self):
-        """Initialize the help system."""
-        self.help_data = self._load_help_data()
-    
-    def _load_help_data(self) -> Dict[str, Any]:
-        """Load comprehensive help data."""
-        return {
-            "overview": {
-                "title": "ROKO Token Data Extractor",
-                "description": "A comprehensive tool for extracting detailed token and liquidity pool pricing data for the ROKO token on the Ethereum blockchain using direct RPC API communications.",
-                "version": "1.0.0",
-                "author": "Chain Data Extractor Team"
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Mapping, Optional
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only mapping proxies."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+@lru_cache(maxsize=1)
+def _load_help_data() -> Mapping[str, Any]:
+    """Load comprehensive help data (built once per process and shared by all HelpSystem instances)."""
+    return _freeze({
+        "overview": {
+            "title": "ROKO Token Data Extractor",
+            "description": "A comprehensive tool for extracting detailed token and liquidity pool pricing data for the ROKO token on the Ethereum blockchain using direct RPC API communications.",
+            "version": "1.0.0",
+            "author": "Chain Data Extractor Team"
+        },
+        "features": {
+            "core": (
+                "Real-time token data extraction from Ethereum blockchain",
+                "Multiple price source integration (CoinGecko, DexScreener, 1inch, Uniswap)",
+                "Uniswap V2/V3 pool detection and analysis",
+                "Complete token holder extraction with Alchemy API",
+                "Historical data tracking with SQLite database",
+                "Advanced analytics for token holders and exchange interactions",
+                "Comprehensive data export (JSON, CSV)",
+                "Real-time monitoring with configurable intervals"
+            ),
+            "analytics": (
+                "Token holder extraction from Transfer events",
+                "Exchange interaction tracking and analysis",
+                "Concentration metrics (Gini coefficient)",
+                "Top holder analysis and wealth distribution",
+                "User behavior patterns and trading analysis",
+                "Liquidity provider identification",
+                "Exchange usage statistics"
+            ),
+            "data_sources": (
+                "Ethereum RPC (eth.llamarpc.com)",
+                "CoinGecko API for token prices",
+                "DexScreener API for DEX data",
+                "1inch API for liquidity pricing",
+                "Direct Uniswap pool integration",
+                "Blockchain event logs analysis"
+            )
+        },
+        "commands": {
+            "basic": {
+                "python run.py": "Basic data extraction with console output",
+                "python run.py --export json": "Extract data and export to JSON",
+                "python run.py --export json csv": "Extract data and export to multiple formats"
             },
-            "features": {
-                "core": [
-                    "Real-time token data extraction from Ethereum blockchain",
-                    "Multiple price source integration (CoinGecko, DexScreener, 1inch, Uniswap)",
-                    "Uniswap V2/V3 pool detection and analysis",
-                    "Complete token holder extraction with Alchemy API",
-                    "Historical data tracking with SQLite database",
-                    "Advanced analytics for token holders and exchange interactions",
-                    "Comprehensive data export (JSON, CSV)",
-                    "Real-time monitoring with configurable intervals"
-                ],
-                "analytics": [
-                    "Token holder extraction from Transfer events",
-                    "Exchange interaction tracking and analysis",
-                    "Concentration metrics (Gini coefficient)",
-                    "Top holder analysis and wealth distribution",
-                    "User behavior patterns and trading analysis",
-                    "Liquidity provider identification",
-                    "Exchange usage statistics"
-                ],
-                "data_sources": [
-                    "Ethereum RPC (eth.llamarpc.com)",
-                    "CoinGecko API for token prices",
-                    "DexScreener API for DEX data",
-                    "1inch API for liquidity pricing",
-                    "Direct Uniswap pool integration",
-                    "Blockchain event logs analysis"
-                ]
+            "advanced": {
+                "python run.py --analytics": "Include advanced analytics in extraction",
+                "python run.py --analytics --export json": "Full extraction with analytics and export",
+                "python run.py --holders": "Extract complete token holder data (requires Alchemy API key)",
+                "python run.py --monitor": "Start real-time monitoring (30s intervals)",
+                "python run.py --monitor --interval 60": "Real-time monitoring with custom interval",
+                "python run.py --historical 30": "Show historical data summary for 30 days"
             },
-            "commands": {
-                "basic": {
-                    "python run.py": "Basic data extraction with console output",
-                    "python run.py --export json": "Extract data and export to JSON",
-                    "python run.py --export json csv": "Extract data and export to multiple formats"
+            "configuration": {
+                "python run.py --config custom.yaml": "Use custom configuration file",
+                "python run.py --help": "Show this help message"
+            }
+        },
+        "examples": {
+            "basic_usage": (
+                "# Basic data extraction",
+                "python run.py",
+                "",
+                "# Export to JSON file",
+                "python run.py --export json",
+                "",
+                "# Export to multiple formats",
+                "python run.py --export json csv"
+            ),
+            "advanced_usage": (
+                "# Full extraction with analytics",
+                "python run.py --analytics --export json",
+                "",
+                "# Complete holder extraction",
+                "python run.py --holders",
+                "",
+                "# Real-time monitoring",
+                "python run.py --monitor --interval 60",
+                "",
+                "# Historical analysis",
+                "python run.py --historical 7"
+            ),
+            "configuration": (
+                "# Use custom configuration",
+                "python run.py --config config/production.yaml",
+                "",
+                "# Monitor with custom settings",
+                "python run.py --monitor --interval 30 --config config/high_freq.yaml"
+            )
+        },
+        "configuration": {
+            "file": "config/config.yaml",
+            "sections": {
+            "ethereum": {
+                "rpc_providers": "List of RPC providers for load balancing",
+                "rpc_url": "Ethereum RPC endpoint URL (legacy single provider)",
+                "api_key": "API key for authentication",
+                "chain_id": "Ethereum chain ID (1 for mainnet)",
+                "gas_limit": "Gas limit for transactions",
+                "load_balancing": "Load balancing configuration"
+            },
+                "roko_token": {
+                    "address": "ROKO token contract address",
+                    "name": "Token name",
+                    "symbol": "Token symbol"
                 },
-                "advanced": {
-                    "python run.py --analytics": "Include advanced analytics in extraction",
-                    "python run.py --analytics --export json": "Full extraction with analytics and export",
-                    "python run.py --holders": "Extract complete token holder data (requires Alchemy API key)",
-                    "python run.py --monitor": "Start real-time monitoring (30s intervals)",
-                    "python run.py --monitor --interval 60": "Real-time monitoring with custom interval",
-                    "python run.py --historical 30": "Show historical data summary for 30 days"
+                "monitoring": {
+                    "update_interval": "Default monitoring interval in seconds",
+                    "historical_data_days": "Days of historical data to keep",
+                    "export_format": "Default export formats",
+                    "log_level": "Logging level (DEBUG, INFO, WARNING, ERROR)",
+                    "analytics_state_dir": "Directory for holder scan checkpoints (enables incremental scans)"
                 },
-                "configuration": {
-                    "python run.py --config custom.yaml": "Use custom configuration file",
-                    "python run.py --help": "Show this help message"
+                "pools": {
+                    "uniswap_v2_factory": "Uniswap V2 factory contract address",
+                    "uniswap_v3_factory": "Uniswap V3 factory contract address",
+                    "weth_address": "WETH contract address",
+                    "usdc_address": "USDC contract address"
                 }
+            }
+        },
+        "output_formats": {
+            "json": {
+                "description": "Complete data structure for programmatic use",
+                "location": "data/exports/roko_data_TIMESTAMP.json",
+                "includes": (
+                    "Token metadata and pricing",
+                    "Pool data and liquidity information",
+                    "Historical data and analytics",
+                    "Exchange interaction data"
+                )
             },
-            "examples": {
-                "basic_usage": [
-                    "# Basic data extraction",
-                    "python run.py",
-                    "",
-                    "# Export to JSON file",
-                    "python run.py --export json",
-                    "",
-                    "# Export to multiple formats",
-                    "python run.py --export json csv"
-                ],
-                "advanced_usage": [
-                    "# Full extraction with analytics",
-                    "python run.py --analytics --export json",
-                    "",
-                    "# Complete holder extraction",
-                    "python run.py --holders",
-                    "",
-                    "# Real-time monitoring",
-                    "python run.py --monitor --interval 60",
-                    "",
-                    "# Historical analysis",
-                    "python run.py --historical 7"
-                ],
-                "configuration": [
-                    "# Use custom configuration",
-                    "python run.py --config config/production.yaml",
-                    "",
-                    "# Monitor with custom settings",
-                    "python run.py --monitor --interval 30 --config config/high_freq.yaml"
-                ]
+            "csv": {
+                "description": "Time-series data for analysis in spreadsheet applications",
+                "location": "data/exports/roko_token_TIMESTAMP.csv",
+                "includes": (
+                    "Token data over time",
+                    "Price history",
+                    "Holder statistics",
+                    "Exchange activity"
+                )
             },
-            "configuration": {
-                "file": "config/config.yaml",
-                "sections": {
-                "ethereum": {
-                    "rpc_providers": "List of RPC providers for load balancing",
-                    "rpc_url": "Ethereum RPC endpoint URL (legacy single provider)",
-                    "api_key": "API key for authentication",
-                    "chain_id": "Ethereum chain ID (1 for mainnet)",
-                    "gas_limit": "Gas limit for transactions",
-                    "load_balancing": "Load balancing configuration"
+            "database": {
+                "description": "SQLite database for historical tracking",
+                "location": "data/historical/token_data.db",
+                "tables": (
+                    "price_history",
+                    "holder_history", 
+                    "exchange_activity"
+                )
+            }
+        },
+        "troubleshooting": {
+            "common_issues": {
+                "rate_limiting": {
+                    "symptom": "429 Client Error: Too Many Requests",
+                    "cause": "RPC endpoint rate limiting",
+                    "solution": "Wait a few minutes or use a different RPC endpoint"
                 },
-                    "roko_token": {
-                        "address": "ROKO token contract address",
-                        "name": "Token name",
-                        "symbol": "Token symbol"
-                    },
-                    "monitoring": {
-                        "update_interval": "Default monitoring interval in seconds",
-                        "historical_data_days": "Days of historical data to keep",
-                        "export_format": "Default export formats",
-                        "log_level": "Logging level (DEBUG, INFO, WARNING, ERROR)"
-                    },
-                    "pools": {
-                        "uniswap_v2_factory": "Uniswap V2 factory contract address",
-                        "uniswap_v3_factory": "Uniswap V3 factory contract address",
-                        "weth_address": "WETH contract address",
-                        "usdc_address": "USDC contract address"
-                    }
-                }
-            },
-            "output_formats": {
-                "json": {
-                    "description": "Complete data structure for programmatic use",
-                    "location": "data/exports/roko_data_TIMESTAMP.json",
-                    "includes": [
-                        "Token metadata and pricing",
-                        "Pool data and liquidity information",
-                        "Historical data and analytics",
-                        "Exchange interaction data"
-                    ]
+                "connection_error": {
+                    "symptom": "Failed to connect to Ethereum node",
+                    "cause": "RPC endpoint unavailable or incorrect URL",
+                    "solution": "Check RPC URL in configuration or try a different endpoint"
                 },
-                "csv": {
-                    "description": "Time-series data for analysis in spreadsheet applications",
-                    "location": "data/exports/roko_token_TIMESTAMP.csv",
-                    "includes": [
-                        "Token data over time",
-                        "Price history",
-                        "Holder statistics",
-                        "Exchange activity"
-                    ]
+                "no_pools_found": {
+                    "symptom": "Found 0 ROKO pools",
+                    "cause": "Token may not have active liquidity pools",
+                    "solution": "This is normal for new or low-liquidity tokens"
                 },
-                "database": {
-                    "description": "SQLite database for historical tracking",
-                    "location": "data/historical/token_data.db",
-                    "tables": [
-                        "price_history",
-                        "holder_history", 
-                        "exchange_activity"
-                    ]
+                "price_data_unavailable": {
+                    "symptom": "Price shows as placeholder values",
+                    "cause": "Price APIs rate limited or token not supported",
+                    "solution": "Check API keys and token address"
                 }
             },
-            "troubleshooting": {
-                "common_issues": {
-                    "rate_limiting": {
-                        "symptom": "429 Client Error: Too Many Requests",
-                        "cause": "RPC endpoint rate limiting",
-                        "solution": "Wait a few minutes or use a different RPC endpoint"
-                    },
-                    "connection_error": {
-                        "symptom": "Failed to connect to Ethereum node",
-                        "cause": "RPC endpoint unavailable or incorrect URL",
-                        "solution": "Check RPC URL in configuration or try a different endpoint"
-                    },
-                    "no_pools_found": {
-                        "symptom": "Found 0 ROKO pools",
-                        "cause": "Token may not have active liquidity pools",
-                        "solution": "This is normal for new or low-liquidity tokens"
-                    },
-                    "price_data_unavailable": {
-                        "symptom": "Price shows as placeholder values",
-                        "cause": "Price APIs rate limited or token not supported",
-                        "solution": "Check API keys and token address"
-                    }
+            "debugging": {
+                "enable_debug_logging": "Set log_level to DEBUG in config.yaml",
+                "check_logs": "View logs/roko_extractor.log for detailed information",
+                "test_connection": "Run python test_connection.py to verify RPC connection",
+                "verify_config": "Check config/config.yaml for correct settings"
+            }
+        },
+        "api_reference": {
+            "price_sources": {
+                "coingecko": {
+                    "url": "https://api.coingecko.com/api/v3/simple/token_price/ethereum",
+                    "rate_limit": "10-50 calls/minute",
+                    "supports": "USD prices for verified tokens"
+                },
+                "dexscreener": {
+                    "url": "https://api.dexscreener.com/latest/dex/tokens/",
+                    "rate_limit": "300 calls/minute",
+                    "supports": "DEX prices and trading data"
                 },
-                "debugging": {
-                    "enable_debug_logging": "Set log_level to DEBUG in config.yaml",
-                    "check_logs": "View logs/roko_extractor.log for detailed information",
-                    "test_connection": "Run python test_connection.py to verify RPC connection",
-                    "verify_config": "Check config/config.yaml for correct settings"
+                "1inch": {
+                    "url": "https://api.1inch.io/v5.0/1/quote",
+                    "rate_limit": "100 calls/minute",
+                    "supports": "Liquidity-based pricing"
+                },
+                "uniswap": {
+                    "method": "Direct pool contract interaction",
+                    "rate_limit": "Depends on RPC provider",
+                    "supports": "Real-time pool-based pricing"
                 }
             },
-            "api_reference": {
-                "price_sources": {
-                    "coingecko": {
-                        "url": "https://api.coingecko.com/api/v3/simple/token_price/ethereum",
-                        "rate_limit": "10-50 calls/minute",
-                        "supports": "USD prices for verified tokens"
-                    },
-                    "dexscreener": {
-                        "url": "https://api.dexscreener.com/latest/dex/tokens/",
-                        "rate_limit": "300 calls/minute",
-                        "supports": "DEX prices and trading data"
-                    },
-                    "1inch": {
-                        "url": "https://api.1inch.io/v5.0/1/quote",
-                        "rate_limit": "100 calls/minute",
-                        "supports": "Liquidity-based pricing"
-                    },
-                    "uniswap": {
-                        "method": "Direct pool contract interaction",
-                        "rate_limit": "Depends on RPC provider",
-                        "supports": "Real-time pool-based pricing"
-                    }
+            "rpc_endpoints": {
+                "eth_llamarpc": {
+                    "url": "https://eth.llamarpc.com",
+                    "type": "Public",
+                    "rate_limit": "Moderate",
+                    "reliability": "Good"
                 },
-                "rpc_endpoints": {
-                    "eth_llamarpc": {
-                        "url": "https://eth.llamarpc.com",
-                        "type": "Public",
-                        "rate_limit": "Moderate",
-                        "reliability": "Good"
-                    },
-                    "alchemy": {
-                        "url": "https://eth-mainnet.g.alchemy.com/v2/YOUR_API_KEY",
-                        "type": "Commercial",
-                        "rate_limit": "High",
-                        "reliability": "Excellent"
-                    }
+                "alchemy": {
+                    "url": "https://eth-mainnet.g.alchemy.com/v2/YOUR_API_KEY",
+                    "type": "Commercial",
+                    "rate_limit": "High",
+                    "reliability": "Excellent"
                 }
             }
         }
+    })
+
+
+# Rendered help text by section (None for the full help)
+_rendered_help: Dict[Optional[str], str] = {}
+
+_UNKNOWN_SECTION_MESSAGE = "Unknown help section: %s"
+
+
+# Static parts of the configuration help, around the configuration file path.
+# Plain strings rather than an f-string, so the {API_KEY} placeholder in the example prints as-is.
+_CONFIGURATION_HELP_HEADER = """
+CONFIGURATION REFERENCE
+======================
+
+Configuration File: """
+
+_CONFIGURATION_HELP_BODY = """
+
+SECTIONS:
+
+Ethereum Settings:
+  rpc_url: Ethereum RPC endpoint URL
+  api_key: API key for authentication (if required)
+  chain_id: Ethereum chain ID (1 for mainnet)
+  gas_limit: Gas limit for transactions
+
+ROKO Token Settings:
+  address: ROKO token contract address
+  name: Token name
+  symbol: Token symbol
+
+Monitoring Settings:
+  update_interval: Default monitoring interval in seconds
+  historical_data_days: Days of historical data to keep
+  export_format: Default export formats (json, csv)
+  log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
+  analytics_state_dir: Directory for holder scan checkpoints (enables incremental scans)
+
+Pool Settings:
+  uniswap_v2_factory: Uniswap V2 factory contract address
+  uniswap_v3_factory: Uniswap V3 factory contract address
+  weth_address: WETH contract address
+  usdc_address: USDC contract address
+
+EXAMPLE CONFIGURATION:
+```yaml
+ethereum:
+  # Multiple RPC providers with load balancing
+  rpc_providers:
+    - name: "eth.llamarpc"
+      url: "https://eth.llamarpc.com"
+      api_key: ""
+      priority: 1
+      rate_limit: 100
+      timeout: 30
+    - name: "alchemy"
+      url: "https://eth-mainnet.g.alchemy.com/v2/{API_KEY}"
+      api_key: "${ALCHEMY_API_KEY}"
+      priority: 2
+      rate_limit: 1000
+      timeout: 30
+    - name: "public"
+      url: "https://ethereum.publicnode.com"
+      api_key: ""
+      priority: 3
+      rate_limit: 50
+      timeout: 30
+  
+  # Legacy single RPC (for backward compatibility)
+  rpc_url: "https://eth.llamarpc.com"
+  api_key: ""
+  
+  # Chain configuration
+  chain_id: 1
+  gas_limit: 100000
+  
+  # Load balancing settings
+  load_balancing:
+    strategy: "round_robin"  # round_robin, priority, random
+    retry_attempts: 3
+    retry_delay: 1
+    health_check_interval: 60
+    max_concurrent_requests: 5
+    max_concurrent_per_provider: 2  # In-flight requests per provider
+
+roko_token:
+  address: "0x6f222e04f6c53cc688ffb0abe7206aac66a8ff98"
+  name: "ROKO"
+  symbol: "ROKO"
+
+monitoring:
+  update_interval: 30
+  historical_data_days: 30
+  export_format: ["json", "csv"]
+  log_level: "INFO"
+  analytics_state_dir: "data/state"
+```
+"""
+
+
+class HelpSystem:
+    """Comprehensive help system with examples and documentation."""
+    
+    # Stateless: the help data and rendered text are shared at module level
+    __slots__ = ()
+    
+    @property
+    def help_data(self) -> Mapping[str, Any]:
+        """Comprehensive help data (read-only, shared), built on first access."""
+        return _load_help_data()
     
     def get_help(self, section: str = None) -> str:
         """Get help information for a specific section or all sections."""
-        if section:
-            return self._format_section(section, self.help_data.get(section, {}))
-        else:
-            return self._format_full_help()
+        section = section or None
+        # The help text is static, so each section is rendered once per process
+        help_text = _rendered_help.get(section)
+        if help_text is None:
+            if section is None:
+                help_text = self._format_full_help()
+            else:
+                formatter = self._FORMATTERS.get(section)
+                if formatter is None:
+                    return _UNKNOWN_SECTION_MESSAGE % section
+                help_text = formatter(self)
+            _rendered_help[section] = help_text
+        return help_text
     
     def _format_full_help(self) -> str:
         """Format the complete help information."""
+        overview = self.help_data['overview']
         help_text = f"""
-{self.help_data['overview']['title']} v{self.help_data['overview']['version']}
-{self.help_data['overview']['description']}
+{overview['title']} v{overview['version']}
+{overview['description']}
 
 USAGE:
     python run.py [OPTIONS]
@@ -295,33 +418,25 @@ For more detailed information, run:
 """
         return help_text
     
-    def _format_section(self, section: str, data: Dict[str, Any]) -> str:
-        """Format a specific help section."""
-        if section == "detailed":
-            return self._format_detailed_help()
-        elif section == "examples":
-            return self._format_examples()
-        elif section == "configuration":
-            return self._format_configuration_help()
-        elif section == "troubleshooting":
-            return self._format_troubleshooting()
-        else:
-            return f"Unknown help section: {section}"
-    
     def _format_detailed_help(self) -> str:
         """Format detailed help information."""
+        features = self.help_data['features']
+        # Joined outside the f-string: replacement fields cannot contain backslashes before Python 3.12
+        core_bullets = "\n".join(f"  • {feature}" for feature in features['core'])
+        analytics_bullets = "\n".join(f"  • {feature}" for feature in features['analytics'])
+        source_bullets = "\n".join(f"  • {source}" for source in features['data_sources'])
         return f"""
 DETAILED FEATURE OVERVIEW
 ========================
 
 CORE FEATURES:
-{chr(10).join(f"  • {feature}" for feature in self.help_data['features']['core'])}
+{core_bullets}
 
 ANALYTICS FEATURES:
-{chr(10).join(f"  • {feature}" for feature in self.help_data['features']['analytics'])}
+{analytics_bullets}
 
 DATA SOURCES:
-{chr(10).join(f"  • {source}" for source in self.help_data['features']['data_sources'])}
+{source_bullets}
 
 OUTPUT FORMATS:
   JSON Export:
@@ -353,18 +468,22 @@ API REFERENCE:
     
     def _format_examples(self) -> str:
         """Format examples help."""
+        examples = self.help_data['examples']
+        basic_usage = "\n".join(examples['basic_usage'])
+        advanced_usage = "\n".join(examples['advanced_usage'])
+        configuration_usage = "\n".join(examples['configuration'])
         return f"""
 USAGE EXAMPLES
 =============
 
 BASIC USAGE:
-{chr(10).join(self.help_data['examples']['basic_usage'])}
+{basic_usage}
 
 ADVANCED USAGE:
-{chr(10).join(self.help_data['examples']['advanced_usage'])}
+{advanced_usage}
 
 CONFIGURATION:
-{chr(10).join(self.help_data['examples']['configuration'])}
+{configuration_usage}
 
 REAL-WORLD SCENARIOS:
 
@@ -387,89 +506,8 @@ REAL-WORLD SCENARIOS:
     
     def _format_configuration_help(self) -> str:
         """Format configuration help."""
-        return f"""
-CONFIGURATION REFERENCE
-======================
-
-Configuration File: {self.help_data['configuration']['file']}
-
-SECTIONS:
-
-Ethereum Settings:
-  rpc_url: Ethereum RPC endpoint URL
-  api_key: API key for authentication (if required)
-  chain_id: Ethereum chain ID (1 for mainnet)
-  gas_limit: Gas limit for transactions
-
-ROKO Token Settings:
-  address: ROKO token contract address
-  name: Token name
-  symbol: Token symbol
-
-Monitoring Settings:
-  update_interval: Default monitoring interval in seconds
-  historical_data_days: Days of historical data to keep
-  export_format: Default export formats (json, csv)
-  log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
-
-Pool Settings:
-  uniswap_v2_factory: Uniswap V2 factory contract address
-  uniswap_v3_factory: Uniswap V3 factory contract address
-  weth_address: WETH contract address
-  usdc_address: USDC contract address
-
-EXAMPLE CONFIGURATION:
-```yaml
-ethereum:
-  # Multiple RPC providers with load balancing
-  rpc_providers:
-    - name: "eth.llamarpc"
-      url: "https://eth.llamarpc.com"
-      api_key: ""
-      priority: 1
-      rate_limit: 100
-      timeout: 30
-    - name: "alchemy"
-      url: "https://eth-mainnet.g.alchemy.com/v2/{API_KEY}"
-      api_key: "${ALCHEMY_API_KEY}"
-      priority: 2
-      rate_limit: 1000
-      timeout: 30
-    - name: "public"
-      url: "https://ethereum.publicnode.com"
-      api_key: ""
-      priority: 3
-      rate_limit: 50
-      timeout: 30
-  
-  # Legacy single RPC (for backward compatibility)
-  rpc_url: "https://eth.llamarpc.com"
-  api_key: ""
-  
-  # Chain configuration
-  chain_id: 1
-  gas_limit: 100000
-  
-  # Load balancing settings
-  load_balancing:
-    strategy: "round_robin"  # round_robin, priority, random
-    retry_attempts: 3
-    retry_delay: 1
-    health_check_interval: 60
-    max_concurrent_requests: 5
-
-roko_token:
-  address: "0x6f222e04f6c53cc688ffb0abe7206aac66a8ff98"
-  name: "ROKO"
-  symbol: "ROKO"
-
-monitoring:
-  update_interval: 30
-  historical_data_days: 30
-  export_format: ["json", "csv"]
-  log_level: "INFO"
-```
-"""
+        configuration = self.help_data['configuration']
+        return "".join((_CONFIGURATION_HELP_HEADER, configuration['file'], _CONFIGURATION_HELP_BODY))
     
     def _format_troubleshooting(self) -> str:
         """Format troubleshooting help."""
@@ -530,3 +568,11 @@ SUPPORT:
 • Test with different RPC endpoints
 • Ensure stable internet connection
 """
+    
+    # Section name -> formatter, for `--help SECTION`
+    _FORMATTERS: Dict[str, Callable[['HelpSystem'], str]] = {
+        "detailed": _format_detailed_help,
+        "examples": _format_examples,
+        "configuration": _format_configuration_help,
+        "troubleshooting": _format_troubleshooting,
+    }
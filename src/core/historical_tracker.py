@@ -5,12 +5,104 @@ Historical data tracking module for price and volume data.
 import json
 import logging
 import sqlite3
-from typing import Dict, Any, List, Optional
+import threading
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
 import time
 
 
+# SQL for the store/get paths, kept as constants so each call reuses sqlite3's cached prepared statement
+_SQL_INSERT_PRICE = '''
+    INSERT INTO price_history
+    (token_address, timestamp, price_eth, price_usd, market_cap_usd, volume_24h, price_source)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_HOLDER = '''
+    INSERT INTO holder_history
+    (token_address, timestamp, total_holders, top_10_percentage, top_100_percentage, gini_coefficient)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_INSERT_EXCHANGE = '''
+    INSERT INTO exchange_activity
+    (token_address, timestamp, exchange_name, transaction_count, volume, unique_users)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_SELECT_PRICE_HISTORY = '''
+    SELECT timestamp, price_eth, price_usd, market_cap_usd, volume_24h, price_source
+    FROM price_history
+    WHERE token_address = ? AND timestamp >= ?
+    ORDER BY timestamp ASC
+'''
+
+_SQL_SELECT_HOLDER_HISTORY = '''
+    SELECT timestamp, total_holders, top_10_percentage, top_100_percentage, gini_coefficient
+    FROM holder_history
+    WHERE token_address = ? AND timestamp >= ?
+    ORDER BY timestamp ASC
+'''
+
+_SQL_SELECT_EXCHANGE_HISTORY = '''
+    SELECT timestamp, exchange_name, transaction_count, volume, unique_users
+    FROM exchange_activity
+    WHERE token_address = ? AND timestamp >= ?
+    ORDER BY exchange_name, timestamp ASC
+'''
+
+_SQL_COUNT_PRICES = '''
+    SELECT COUNT(*) FROM price_history
+    WHERE token_address = ? AND timestamp >= ?
+'''
+
+_SQL_PRICE_RANGE = '''
+    SELECT MIN(price_usd), MAX(price_usd), AVG(price_usd) FROM price_history
+    WHERE token_address = ? AND timestamp >= ? AND price_usd != 0
+'''
+
+_SQL_SELECT_PRICE_SERIES = '''
+    SELECT price_usd FROM price_history
+    WHERE token_address = ? AND timestamp >= ? AND price_usd != 0
+    ORDER BY timestamp ASC
+'''
+
+_SQL_HOLDER_STATS = '''
+    SELECT COUNT(*), MIN(total_holders), MAX(total_holders), AVG(total_holders) FROM holder_history
+    WHERE token_address = ? AND timestamp >= ? AND total_holders != 0
+'''
+
+_SQL_HOLDER_FIRST_LAST = '''
+    SELECT
+        (SELECT total_holders FROM holder_history
+         WHERE token_address = ?1 AND timestamp >= ?2 AND total_holders != 0
+         ORDER BY timestamp ASC LIMIT 1),
+        (SELECT total_holders FROM holder_history
+         WHERE token_address = ?1 AND timestamp >= ?2 AND total_holders != 0
+         ORDER BY timestamp DESC LIMIT 1)
+'''
+
+_SQL_EXCHANGE_COUNTS = '''
+    SELECT exchange_name, COUNT(*) FROM exchange_activity
+    WHERE token_address = ? AND timestamp >= ?
+    GROUP BY exchange_name
+    ORDER BY MIN(timestamp), MIN(id)
+'''
+
+
+
+def _decode_price_sources(value: Optional[str]) -> List[str]:
+    """Decode a stored price_source column (JSON array, or comma-separated in rows written before the switch)."""
+    if not value:
+        return []
+    if value.startswith('['):
+        return json.loads(value)
+    return value.split(',')
+
+
 class HistoricalTracker:
     """Track and store historical token data."""
     
@@ -25,15 +117,92 @@ class HistoricalTracker:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.logger = logging.getLogger(__name__)
         
+        # One long-lived connection per thread, reused across calls so SQLite's page cache stays warm
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # Writers queue here rather than in SQLite's sleep-and-retry busy handler
+        self._write_lock = threading.Lock()
+        
         # Initialize database
         self._init_database()
     
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open a database connection with the tracker's per-connection settings applied.
+        
+        Args:
+            read_only: Open the database file read-only (for the history getters)
+            
+        Returns:
+            New SQLite connection
+        """
+        # timeout makes a writer wait up to 5s for a lock instead of failing with "database is locked";
+        # check_same_thread is off only so close() can close other threads' connections
+        if read_only:
+            conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True,
+                                   timeout=5, check_same_thread=False)
+            conn.execute('PRAGMA query_only=1')
+        else:
+            # IMMEDIATE: the implicit BEGIN before an insert takes the write lock up front, so a
+            # transaction never has to upgrade from a read lock and hit SQLITE_BUSY partway through
+            conn = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False,
+                                   isolation_level='IMMEDIATE')
+            # With WAL, NORMAL only syncs at checkpoints; a crash can lose the last commits but not corrupt the DB
+            conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=268435456')
+        conn.execute('PRAGMA cache_size=-65536')
+        return conn
+    
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Get this thread's read-write database connection, opening it on first use.
+        
+        Use it as a context manager (`with self._connection() as conn:`) to commit or roll back
+        a transaction; the connection itself stays open until close().
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self._register(self._connect())
+        return conn
+    
+    def _read_connection(self) -> sqlite3.Connection:
+        """Get this thread's read-only database connection, opening it on first use."""
+        # Under WAL any number of read-only connections run alongside the writer without taking its lock
+        conn = getattr(self._local, 'ro_conn', None)
+        if conn is None:
+            conn = self._local.ro_conn = self._register(self._connect(read_only=True))
+        return conn
+    
+    def _register(self, conn: sqlite3.Connection) -> sqlite3.Connection:
+        """Track a connection so close() can close it."""
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+    
+    def close(self):
+        """Close all database connections opened by this tracker."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                self.logger.warning(f"Error closing database connection: {e}")
+        # Threads still holding a closed connection reopen one on their next call
+        self._local = threading.local()
+    
     def _init_database(self):
         """Initialize the SQLite database with required tables."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._write_lock, self._connection() as conn:
                 cursor = conn.cursor()
                 
+                # Write-ahead logging: one fsync per checkpoint instead of per commit, and readers
+                # don't block the writer (persistent, stored in the database file)
+                cursor.execute('PRAGMA journal_mode=WAL')
+                
                 # Create price history table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS price_history (
@@ -44,8 +213,7 @@ class HistoricalTracker:
                         price_usd REAL,
                         market_cap_usd REAL,
                         volume_24h REAL,
-                        price_source TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        price_source TEXT
                     )
                 ''')
                 
@@ -58,8 +226,7 @@ class HistoricalTracker:
                         total_holders INTEGER,
                         top_10_percentage REAL,
                         top_100_percentage REAL,
-                        gini_coefficient REAL,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        gini_coefficient REAL
                     )
                 ''')
                 
@@ -72,15 +239,34 @@ class HistoricalTracker:
                         exchange_name TEXT NOT NULL,
                         transaction_count INTEGER,
                         volume REAL,
-                        unique_users INTEGER,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        unique_users INTEGER
+                    )
+                ''')
+                
+                # Create indexes for better performance. The price and holder indexes carry every column
+                # the history queries read, so range scans never go back to the table rows.
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_price_cover ON price_history(
+                        token_address, timestamp, price_eth, price_usd, market_cap_usd, volume_24h, price_source
+                    )
+                ''')
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_holder_cover ON holder_history(
+                        token_address, timestamp, total_holders, top_10_percentage, top_100_percentage, gini_coefficient
+                    )
+                ''')
+                # Exchange history is read grouped per exchange, so index it in that order
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_exchange_by_name ON exchange_activity(
+                        token_address, exchange_name, timestamp, transaction_count, volume, unique_users
                     )
                 ''')
+                # Superseded by the covering indexes above (same leading columns)
+                cursor.execute('DROP INDEX IF EXISTS idx_price_token_timestamp')
+                cursor.execute('DROP INDEX IF EXISTS idx_holder_token_timestamp')
+                cursor.execute('DROP INDEX IF EXISTS idx_exchange_token_timestamp')
                 
-                # Create indexes for better performance
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_price_token_timestamp ON price_history(token_address, timestamp)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_holder_token_timestamp ON holder_history(token_address, timestamp)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_exchange_token_timestamp ON exchange_activity(token_address, timestamp)')
+                self._migrate_schema(conn)
                 
                 conn.commit()
                 self.logger.info("Database initialized successfully")
@@ -89,6 +275,21 @@ class HistoricalTracker:
             self.logger.error(f"Error initializing database: {e}")
             raise
     
+    def _migrate_schema(self, conn: sqlite3.Connection):
+        """Bring databases created by older versions up to the current schema (tracked in user_version)."""
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        
+        if version < 1:
+            # v1: drop the never-read created_at column (ALTER TABLE DROP COLUMN needs SQLite 3.35+)
+            if sqlite3.sqlite_version_info < (3, 35, 0):
+                self.logger.info("SQLite too old to drop created_at columns; keeping them")
+                return
+            for table in ('price_history', 'holder_history', 'exchange_activity'):
+                columns = [row[1] for row in conn.execute(f'PRAGMA table_info({table})')]
+                if 'created_at' in columns:
+                    conn.execute(f'ALTER TABLE {table} DROP COLUMN created_at')
+            conn.execute('PRAGMA user_version = 1')
+    
     def store_price_data(self, token_address: str, price_data: Dict[str, Any]) -> bool:
         """
         Store price data in the database.
@@ -97,28 +298,38 @@ class HistoricalTracker:
             token_address: Token contract address
             price_data: Price data dictionary
             
+        Returns:
+            True if successful, False otherwise
+        """
+        return self.store_price_data_bulk(token_address, [price_data])
+    
+    def store_price_data_bulk(self, token_address: str, price_records: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Store many price data points in one transaction.
+        
+        Args:
+            token_address: Token contract address
+            price_records: Price data dictionaries (same shape as for store_price_data)
+            
         Returns:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute('''
-                    INSERT INTO price_history 
-                    (token_address, timestamp, price_eth, price_usd, market_cap_usd, volume_24h, price_source)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
+            rows = [
+                (
                     token_address,
                     price_data.get('timestamp', int(time.time())),
                     price_data.get('token_price_eth'),
                     price_data.get('token_price_usd'),
                     price_data.get('market_cap_usd'),
                     price_data.get('volume_24h'),
-                    ','.join(price_data.get('price_sources', []))
-                ))
-                
-                conn.commit()
+                    json.dumps(price_data.get('price_sources', []), separators=(',', ':'))
+                )
+                for price_data in price_records
+            ]
+            
+            with self._write_lock, self._connection() as conn:
+                conn.executemany(_SQL_INSERT_PRICE, rows)
                 return True
                 
         except Exception as e:
@@ -133,20 +344,27 @@ class HistoricalTracker:
             token_address: Token contract address
             holder_data: Holder data dictionary
             
+        Returns:
+            True if successful, False otherwise
+        """
+        return self.store_holder_data_bulk(token_address, [holder_data])
+    
+    def store_holder_data_bulk(self, token_address: str, holder_records: Iterable[Dict[str, Any]]) -> bool:
+        """
+        Store many holder data points in one transaction.
+        
+        Args:
+            token_address: Token contract address
+            holder_records: Holder data dictionaries (same shape as for store_holder_data)
+            
         Returns:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
+            rows = []
+            for holder_data in holder_records:
                 concentration = holder_data.get('concentration_metrics', {})
-                
-                cursor.execute('''
-                    INSERT INTO holder_history 
-                    (token_address, timestamp, total_holders, top_10_percentage, top_100_percentage, gini_coefficient)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
+                rows.append((
                     token_address,
                     holder_data.get('scan_range', {}).get('to_block', int(time.time())),
                     holder_data.get('total_holders'),
@@ -154,8 +372,9 @@ class HistoricalTracker:
                     concentration.get('top_100_percentage'),
                     concentration.get('gini_coefficient')
                 ))
-                
-                conn.commit()
+            
+            with self._write_lock, self._connection() as conn:
+                conn.executemany(_SQL_INSERT_HOLDER, rows)
                 return True
                 
         except Exception as e:
@@ -174,27 +393,24 @@ class HistoricalTracker:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                exchange_breakdown = exchange_data.get('exchange_breakdown', {})
-                timestamp = exchange_data.get('scan_range', {}).get('to_block', int(time.time()))
-                
-                for exchange_name, data in exchange_breakdown.items():
-                    cursor.execute('''
-                        INSERT INTO exchange_activity 
-                        (token_address, timestamp, exchange_name, transaction_count, volume, unique_users)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (
-                        token_address,
-                        timestamp,
-                        exchange_name,
-                        data.get('transaction_count'),
-                        data.get('total_volume'),
-                        data.get('unique_users')
-                    ))
-                
-                conn.commit()
+            exchange_breakdown = exchange_data.get('exchange_breakdown', {})
+            timestamp = exchange_data.get('scan_range', {}).get('to_block', int(time.time()))
+            
+            rows = [
+                (
+                    token_address,
+                    timestamp,
+                    exchange_name,
+                    data.get('transaction_count'),
+                    data.get('total_volume'),
+                    data.get('unique_users')
+                )
+                for exchange_name, data in exchange_breakdown.items()
+            ]
+            
+            # One statement and one transaction for all exchanges (the context manager commits)
+            with self._write_lock, self._connection() as conn:
+                conn.executemany(_SQL_INSERT_EXCHANGE, rows)
                 return True
                 
         except Exception as e:
@@ -213,37 +429,28 @@ class HistoricalTracker:
             List of price data dictionaries
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Calculate timestamp for days ago
-                cutoff_timestamp = int(time.time()) - (days * 24 * 60 * 60)
-                
-                cursor.execute('''
-                    SELECT timestamp, price_eth, price_usd, market_cap_usd, volume_24h, price_source
-                    FROM price_history
-                    WHERE token_address = ? AND timestamp >= ?
-                    ORDER BY timestamp ASC
-                ''', (token_address, cutoff_timestamp))
-                
-                rows = cursor.fetchall()
-                
-                return [
-                    {
-                        'timestamp': row[0],
-                        'price_eth': row[1],
-                        'price_usd': row[2],
-                        'market_cap_usd': row[3],
-                        'volume_24h': row[4],
-                        'price_source': row[5].split(',') if row[5] else []
-                    }
-                    for row in rows
-                ]
-                
+            return list(self._iter_price_history(token_address, days))
         except Exception as e:
             self.logger.error(f"Error getting price history: {e}")
             return []
     
+    def _iter_price_history(self, token_address: str, days: int) -> Iterator[Dict[str, Any]]:
+        """Yield price data points oldest first, reading rows straight off the cursor."""
+        # Calculate timestamp for days ago
+        cutoff_timestamp = int(time.time()) - (days * 24 * 60 * 60)
+        
+        cursor = self._read_connection().execute(_SQL_SELECT_PRICE_HISTORY, (token_address, cutoff_timestamp))
+        
+        for row in cursor:
+            yield {
+                'timestamp': row[0],
+                'price_eth': row[1],
+                'price_usd': row[2],
+                'market_cap_usd': row[3],
+                'volume_24h': row[4],
+                'price_source': _decode_price_sources(row[5])
+            }
+    
     def get_holder_history(self, token_address: str, days: int = 30) -> List[Dict[str, Any]]:
         """
         Get historical holder data.
@@ -256,35 +463,26 @@ class HistoricalTracker:
             List of holder data dictionaries
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                cutoff_timestamp = int(time.time()) - (days * 24 * 60 * 60)
-                
-                cursor.execute('''
-                    SELECT timestamp, total_holders, top_10_percentage, top_100_percentage, gini_coefficient
-                    FROM holder_history
-                    WHERE token_address = ? AND timestamp >= ?
-                    ORDER BY timestamp ASC
-                ''', (token_address, cutoff_timestamp))
-                
-                rows = cursor.fetchall()
-                
-                return [
-                    {
-                        'timestamp': row[0],
-                        'total_holders': row[1],
-                        'top_10_percentage': row[2],
-                        'top_100_percentage': row[3],
-                        'gini_coefficient': row[4]
-                    }
-                    for row in rows
-                ]
-                
+            return list(self._iter_holder_history(token_address, days))
         except Exception as e:
             self.logger.error(f"Error getting holder history: {e}")
             return []
     
+    def _iter_holder_history(self, token_address: str, days: int) -> Iterator[Dict[str, Any]]:
+        """Yield holder data points oldest first, reading rows straight off the cursor."""
+        cutoff_timestamp = int(time.time()) - (days * 24 * 60 * 60)
+        
+        cursor = self._read_connection().execute(_SQL_SELECT_HOLDER_HISTORY, (token_address, cutoff_timestamp))
+        
+        for row in cursor:
+            yield {
+                'timestamp': row[0],
+                'total_holders': row[1],
+                'top_10_percentage': row[2],
+                'top_100_percentage': row[3],
+                'gini_coefficient': row[4]
+            }
+    
     def get_exchange_history(self, token_address: str, days: int = 30) -> Dict[str, List[Dict[str, Any]]]:
         """
         Get historical exchange activity data.
@@ -297,33 +495,25 @@ class HistoricalTracker:
             Dictionary with exchange activity data by exchange
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._read_connection() as conn:
                 cursor = conn.cursor()
                 
                 cutoff_timestamp = int(time.time()) - (days * 24 * 60 * 60)
                 
-                cursor.execute('''
-                    SELECT timestamp, exchange_name, transaction_count, volume, unique_users
-                    FROM exchange_activity
-                    WHERE token_address = ? AND timestamp >= ?
-                    ORDER BY timestamp ASC
-                ''', (token_address, cutoff_timestamp))
+                cursor.execute(_SQL_SELECT_EXCHANGE_HISTORY, (token_address, cutoff_timestamp))
                 
-                rows = cursor.fetchall()
-                
-                # Group by exchange
+                # Rows arrive sorted by exchange, so each exchange is one contiguous run
                 exchange_data = {}
-                for row in rows:
-                    exchange_name = row[1]
-                    if exchange_name not in exchange_data:
-                        exchange_data[exchange_name] = []
-                    
-                    exchange_data[exchange_name].append({
-                        'timestamp': row[0],
-                        'transaction_count': row[2],
-                        'volume': row[3],
-                        'unique_users': row[4]
-                    })
+                for exchange_name, rows in groupby(cursor, key=itemgetter(1)):
+                    exchange_data[exchange_name] = [
+                        {
+                            'timestamp': row[0],
+                            'transaction_count': row[2],
+                            'volume': row[3],
+                            'unique_users': row[4]
+                        }
+                        for row in rows
+                    ]
                 
                 return exchange_data
                 
@@ -343,45 +533,59 @@ class HistoricalTracker:
             Dictionary with summary statistics
         """
         try:
-            price_history = self.get_price_history(token_address, days)
-            holder_history = self.get_holder_history(token_address, days)
-            exchange_history = self.get_exchange_history(token_address, days)
+            cutoff_timestamp = int(time.time()) - (days * 24 * 60 * 60)
+            window = (token_address, cutoff_timestamp)
             
-            if not price_history:
-                return {'error': 'No historical data available'}
+            # Aggregate in SQLite rather than pulling every history row into Python
+            with self._read_connection() as conn:
+                data_points = conn.execute(_SQL_COUNT_PRICES, window).fetchone()[0]
+                
+                if not data_points:
+                    return {'error': 'No historical data available'}
+                
+                # Calculate price statistics (NULL and zero prices are not data points)
+                min_price, max_price, avg_price = conn.execute(_SQL_PRICE_RANGE, window).fetchone()
+                # Volatility needs the whole series, but only this one column
+                prices = [row[0] for row in conn.execute(_SQL_SELECT_PRICE_SERIES, window)]
+                
+                # Calculate holder statistics
+                holder_count, min_holders, max_holders, avg_holders = conn.execute(_SQL_HOLDER_STATS, window).fetchone()
+                first_holders = last_holders = 0
+                if holder_count:
+                    first_holders, last_holders = conn.execute(_SQL_HOLDER_FIRST_LAST, window).fetchone()
+                
+                # Exchange snapshot counts, in order of each exchange's first appearance
+                exchange_activity = {
+                    exchange_name: count
+                    for exchange_name, count in conn.execute(_SQL_EXCHANGE_COUNTS, window)
+                }
             
-            # Calculate price statistics
-            prices = [p['price_usd'] for p in price_history if p['price_usd']]
             if prices:
                 price_stats = {
                     'current_price': prices[-1],
-                    'min_price': min(prices),
-                    'max_price': max(prices),
-                    'avg_price': sum(prices) / len(prices),
+                    'min_price': min_price,
+                    'max_price': max_price,
+                    'avg_price': avg_price,
                     'price_change_24h': ((prices[-1] - prices[-2]) / prices[-2] * 100) if len(prices) > 1 else 0,
                     'volatility': self._calculate_volatility(prices)
                 }
             else:
                 price_stats = {}
             
-            # Calculate holder statistics
-            holders = [h['total_holders'] for h in holder_history if h['total_holders']]
             holder_stats = {
-                'current_holders': holders[-1] if holders else 0,
-                'min_holders': min(holders) if holders else 0,
-                'max_holders': max(holders) if holders else 0,
-                'avg_holders': sum(holders) / len(holders) if holders else 0,
-                'holder_growth': ((holders[-1] - holders[0]) / holders[0] * 100) if len(holders) > 1 and holders[0] > 0 else 0
+                'current_holders': last_holders,
+                'min_holders': min_holders if holder_count else 0,
+                'max_holders': max_holders if holder_count else 0,
+                'avg_holders': avg_holders if holder_count else 0,
+                'holder_growth': ((last_holders - first_holders) / first_holders * 100) if holder_count > 1 and first_holders > 0 else 0
             }
             
             return {
                 'period_days': days,
-                'data_points': len(price_history),
+                'data_points': data_points,
                 'price_statistics': price_stats,
                 'holder_statistics': holder_stats,
-                'exchange_activity': {
-                    name: len(data) for name, data in exchange_history.items()
-                }
+                'exchange_activity': exchange_activity
             }
             
         except Exception as e:
@@ -393,14 +597,20 @@ class HistoricalTracker:
         if len(prices) < 2:
             return 0.0
         
-        returns = []
-        for i in range(1, len(prices)):
-            if prices[i-1] != 0:
-                returns.append((prices[i] - prices[i-1]) / prices[i-1])
+        # Welford's online variance: one pass over consecutive pairs, no returns list
+        count = 0
+        mean_return = 0.0
+        sum_squares = 0.0
+        for previous, current in zip(prices, prices[1:]):
+            if previous == 0:
+                continue
+            r = (current - previous) / previous
+            count += 1
+            delta = r - mean_return
+            mean_return += delta / count
+            sum_squares += delta * (r - mean_return)
         
-        if not returns:
+        if not count:
             return 0.0
         
-        mean_return = sum(returns) / len(returns)
-        variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-        return variance ** 0.5
+        return (sum_squares / count) ** 0.5
@@ -248,7 +248,6 @@ class UniswapPoolMonitor:
             Dictionary with volume data
         """
         try:
-            import requests
             import os
             import time
             from datetime import datetime, timedelta
@@ -300,7 +299,7 @@ class UniswapPoolMonitor:
                         "id": 1
                     }
                     
-                    response = requests.post(url, json=payload, timeout=30)
+                    response = self.rpc_client.session.post(url, json=payload, timeout=30)
                     response.raise_for_status()
                     
                     data = response.json()
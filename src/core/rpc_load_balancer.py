@@ -5,10 +5,12 @@ RPC Load Balancer for managing multiple Ethereum RPC providers with failover and
 import time
 import random
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import threading
+from typing import List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import requests
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 from web3.exceptions import ContractLogicError
 from utils.rpc_ignore_list import RPCIgnoreList
@@ -42,15 +44,17 @@ class RPCProvider:
 class RPCLoadBalancer:
     """Load balancer for multiple RPC providers with failover and rate limiting."""
     
-    def __init__(self, providers: List[Dict[str, Any]], config: Dict[str, Any]):
+    def __init__(self, providers: List[Dict[str, Any]], config: Dict[str, Any], session: Optional[requests.Session] = None):
         """
         Initialize the RPC load balancer.
         
         Args:
             providers: List of RPC provider configurations
             config: Load balancing configuration
+            session: HTTP session shared by all providers (a pooled one is created if omitted)
         """
         self.logger = logging.getLogger(__name__)
+        self.session = session or self.create_session()
         self.providers = []
         self.current_index = 0
         self.config = config
@@ -76,17 +80,48 @@ class RPCLoadBalancer:
         self.strategy = LoadBalancingStrategy(config.get('strategy', 'round_robin'))
         self.retry_attempts = config.get('retry_attempts', 3)
         self.retry_delay = config.get('retry_delay', 1)
+        self.max_retry_delay = config.get('max_retry_delay', 30)
+        self.retry_jitter = config.get('retry_jitter', 0.5)
         self.health_check_interval = config.get('health_check_interval', 60)
         self.max_concurrent_requests = config.get('max_concurrent_requests', 5)
+        self.max_concurrent_per_provider = config.get('max_concurrent_per_provider', 2)
+        
+        # In-flight request slots per provider, so parallel scans spread across providers
+        self._provider_slots = {
+            provider.url: threading.BoundedSemaphore(self.max_concurrent_per_provider)
+            for provider in self.providers
+        }
         
         self.last_health_check = 0
         self.active_requests = 0
         
+        # One Web3 instance per provider URL, reused by every request to that provider
+        self._web3_by_url: Dict[str, Web3] = {}
+        
         self.logger.info(f"Initialized RPC Load Balancer with {len(self.providers)} providers")
         self.logger.info(f"Strategy: {self.strategy.value}")
     
-    def get_provider(self) -> Optional[RPCProvider]:
-        """Get the next available RPC provider based on the load balancing strategy."""
+    @staticmethod
+    def create_session() -> requests.Session:
+        """Create an HTTP session with connection pooling and keep-alive for JSON-RPC calls."""
+        session = requests.Session()
+        # Retries are handled by execute_request, so the adapter must not retry on its own
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers['Content-Type'] = 'application/json'
+        return session
+    
+    def get_provider(self, exclude: Optional[Set[str]] = None) -> Optional[RPCProvider]:
+        """
+        Get the next available RPC provider based on the load balancing strategy.
+        
+        Args:
+            exclude: Provider URLs to avoid if any other provider is available
+            
+        Returns:
+            Selected provider, or None if no provider is available
+        """
         # Check if we need to perform health checks
         if time.time() - self.last_health_check > self.health_check_interval:
             self._perform_health_checks()
@@ -102,6 +137,9 @@ class RPCLoadBalancer:
             self.logger.error("No healthy RPC providers available")
             return None
         
+        if exclude:
+            healthy_providers = [p for p in healthy_providers if p.url not in exclude] or healthy_providers
+        
         # Select provider based on strategy
         if self.strategy == LoadBalancingStrategy.ROUND_ROBIN:
             provider = self._round_robin_selection(healthy_providers)
@@ -153,7 +191,7 @@ class RPCLoadBalancer:
         for provider in self.providers:
             try:
                 # Simple health check - try to get latest block
-                web3 = Web3(Web3.HTTPProvider(provider.url, request_kwargs={'timeout': 5}))
+                web3 = Web3(Web3.HTTPProvider(provider.url, request_kwargs={'timeout': 5}, session=self.session))
                 if web3.is_connected():
                     latest_block = web3.eth.get_block('latest')
                     if latest_block and latest_block.number > 0:
@@ -185,14 +223,18 @@ class RPCLoadBalancer:
             Result of request_func execution
         """
         last_error = None
+        failed_urls = set()
         
         for attempt in range(self.retry_attempts):
-            provider = self.get_provider()
+            retry_delay = None
+            provider = self._acquire_provider(failed_urls)
             if not provider:
                 raise Exception("No healthy RPC providers available")
+            slot = self._provider_slots[provider.url]
             
             # Check rate limiting
             if not self._check_rate_limit(provider):
+                slot.release()
                 self.logger.warning(f"Rate limit exceeded for {provider.name}, trying next provider")
                 # Add to rate limit list for temporary cooldown
                 self.rate_limit_list.add_rate_limited_endpoint(
@@ -220,9 +262,14 @@ class RPCLoadBalancer:
                 provider.last_error = None
                 
                 return result
+            
+            except ContractLogicError:
+                # Reverts are deterministic, retrying on another provider won't help
+                raise
                 
             except Exception as e:
                 last_error = e
+                failed_urls.add(provider.url)
                 provider.error_count += 1
                 provider.last_error = str(e)
                 
@@ -241,11 +288,12 @@ class RPCLoadBalancer:
                 
                 if error_code:
                     if error_code == 429:
-                        # Add to rate limit list for temporary cooldown
+                        # Add to rate limit list for temporary cooldown (as long as the provider asks, if it says)
                         self.rate_limit_list.add_rate_limited_endpoint(
                             provider.url, 
                             error_code, 
-                            str(e)
+                            str(e),
+                            cooldown_seconds=self._get_retry_after(e)
                         )
                     elif error_code != 404:
                         # Add to ignore list for other non-404 errors
@@ -260,24 +308,85 @@ class RPCLoadBalancer:
                     provider.is_healthy = False
                     self.logger.error(f"Marking {provider.name} as unhealthy due to repeated errors")
                 
-                # Wait before retry
+                # Wait before retry (after the slot is released below, so the backoff doesn't hold it)
                 if attempt < self.retry_attempts - 1:
-                    time.sleep(self.retry_delay * (attempt + 1))
+                    retry_delay = self._get_retry_delay(attempt)
             
             finally:
                 self.active_requests = max(0, self.active_requests - 1)
+                slot.release()
+            
+            if retry_delay:
+                time.sleep(retry_delay)
         
         # All attempts failed
         raise Exception(f"All RPC providers failed. Last error: {last_error}")
     
-    def _create_web3_instance(self, provider: RPCProvider) -> Web3:
-        """Create a Web3 instance for the given provider."""
-        # Replace API key placeholder if present
-        url = provider.url
-        if '{API_KEY}' in url and provider.api_key:
-            url = url.replace('{API_KEY}', provider.api_key)
+    def _acquire_provider(self, exclude: Set[str]) -> Optional[RPCProvider]:
+        """
+        Select a provider and take one of its in-flight slots.
         
-        return Web3(Web3.HTTPProvider(url, request_kwargs={'timeout': provider.timeout}))
+        If the selected provider is saturated, another available provider with a free
+        slot is used instead; if every provider is busy, waits for the selected one for
+        up to its request timeout.
+        
+        Args:
+            exclude: Provider URLs that already failed this request
+            
+        Returns:
+            Provider whose slot is now held (release it when done), or None if none is available
+            or no slot freed up in time
+        """
+        provider = self.get_provider(exclude)
+        if not provider:
+            return None
+        
+        if self._provider_slots[provider.url].acquire(blocking=False):
+            return provider
+        
+        for other in self.providers:
+            if (other is not provider and other.url not in exclude and other.is_healthy
+                    and not self.ignore_list.is_ignored(other.url)
+                    and not self.rate_limit_list.is_rate_limited(other.url)
+                    and self._provider_slots[other.url].acquire(blocking=False)):
+                return other
+        
+        if self._provider_slots[provider.url].acquire(timeout=provider.timeout):
+            return provider
+        
+        self.logger.warning(f"Timed out waiting for a free request slot on {provider.name}")
+        return None
+    
+    @staticmethod
+    def _get_retry_after(error: Exception) -> Optional[float]:
+        """Get the Retry-After delay in seconds from an HTTP error response, if present."""
+        response = getattr(error, 'response', None)
+        retry_after = getattr(response, 'headers', {}).get('Retry-After') if response is not None else None
+        try:
+            return float(retry_after) if retry_after is not None else None
+        except ValueError:
+            # HTTP-date form; fall back to the default cooldown
+            return None
+    
+    def _get_retry_delay(self, attempt: int) -> float:
+        """Get the exponential backoff delay (with jitter) before the next retry."""
+        delay = min(self.max_retry_delay, self.retry_delay * (2 ** attempt))
+        # Jitter spreads out retries so concurrent callers don't retry in lockstep
+        return delay * (1 + random.random() * self.retry_jitter)
+    
+    def _create_web3_instance(self, provider: RPCProvider) -> Web3:
+        """Get the Web3 instance for the given provider, creating it on first use."""
+        web3 = self._web3_by_url.get(provider.url)
+        if web3 is None:
+            # Replace API key placeholder if present
+            url = provider.url
+            if '{API_KEY}' in url and provider.api_key:
+                url = url.replace('{API_KEY}', provider.api_key)
+            
+            web3 = Web3(Web3.HTTPProvider(url, request_kwargs={'timeout': provider.timeout}, session=self.session))
+            # Concurrent first requests may race here; keep whichever instance was stored first
+            web3 = self._web3_by_url.setdefault(provider.url, web3)
+        return web3
     
     def _check_rate_limit(self, provider: RPCProvider) -> bool:
         """Check if provider is within rate limits."""
@@ -7,6 +7,7 @@ import time
 from typing import Dict, Any, List, Optional
 from web3 import Web3
 from .enhanced_rpc_client import EnhancedEthereumRPCClient
+from .analytics import TRANSFER_TOPIC, decode_uint256
 
 
 class ROKOTokenAnalyzer:
@@ -151,15 +152,20 @@ class ROKOTokenAnalyzer:
             # Get total supply
             total_supply = self.get_total_supply()
             
-            # Calculate treasury holdings
+            # Calculate treasury holdings (all wallets in one batched request)
             treasury_holdings = 0
+            try:
+                balances = self.rpc_client.get_token_balances(self.roko_address, treasury_wallets)
+            except Exception as e:
+                self.logger.warning(f"Error getting balances for treasury wallets: {e}")
+                balances = {}
+            
             for wallet in treasury_wallets:
-                try:
-                    balance = self.rpc_client.get_token_balance(self.roko_address, wallet)
-                    treasury_holdings += balance
-                    self.logger.debug(f"Treasury wallet {wallet}: {balance} tokens")
-                except Exception as e:
-                    self.logger.warning(f"Error getting balance for treasury wallet {wallet}: {e}")
+                if wallet in balances:
+                    treasury_holdings += balances[wallet]
+                    self.logger.debug(f"Treasury wallet {wallet}: {balances[wallet]} tokens")
+                else:
+                    self.logger.warning(f"Error getting balance for treasury wallet {wallet}")
             
             # Calculate circulating supply
             circulating_supply = total_supply - treasury_holdings
@@ -202,7 +208,6 @@ class ROKOTokenAnalyzer:
     def _get_holder_count_alchemy(self) -> Optional[int]:
         """Get holder count using Alchemy API."""
         try:
-            import requests
             import os
             
             # Get Alchemy API key from environment
@@ -223,7 +228,7 @@ class ROKOTokenAnalyzer:
                 "id": 1
             }
             
-            response = requests.post(url, json=payload, timeout=30)
+            response = self.rpc_client.session.post(url, json=payload, timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -248,14 +253,12 @@ class ROKOTokenAnalyzer:
             latest_block = self.rpc_client.get_latest_block()
             from_block = max(0, latest_block['number'] - 1000)
             
-            # Transfer event signature: Transfer(address indexed from, address indexed to, uint256 value)
-            transfer_topic = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
-            
+            # Transfer(address indexed from, address indexed to, uint256 value) events
             logs = self.rpc_client.get_logs(
                 from_block=from_block,
                 to_block='latest',
                 address=self.roko_address,
-                topics=[transfer_topic]
+                topics=[TRANSFER_TOPIC]
             )
             
             # Count unique addresses from Transfer events
@@ -279,14 +282,12 @@ class ROKOTokenAnalyzer:
             latest_block = self.rpc_client.get_latest_block()
             from_block = max(0, latest_block['number'] - 1000)
             
-            # Transfer event signature
-            transfer_topic = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
-            
+            # Recent Transfer events
             logs = self.rpc_client.get_logs(
                 from_block=from_block,
                 to_block='latest',
                 address=self.roko_address,
-                topics=[transfer_topic]
+                topics=[TRANSFER_TOPIC]
             )
             
             transactions = []
@@ -295,9 +296,8 @@ class ROKOTokenAnalyzer:
                     from_addr = "0x" + log['topics'][1][-40:]
                     to_addr = "0x" + log['topics'][2][-40:]
                     
-                    # Decode the value from the data field
-                    value_hex = log['data'][2:]  # Remove '0x' prefix
-                    value = int(value_hex, 16) if value_hex else 0
+                    # Decode the value from the data field (raw bytes, or a 0x-prefixed hex string)
+                    value = decode_uint256(log['data'])
                     
                     transactions.append({
                         'from': from_addr,
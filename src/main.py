@@ -59,7 +59,8 @@ class ROKODataExtractor:
         # Initialize analytics and historical tracking
         self.analytics = TokenAnalytics(
             rpc_client=self.rpc_client,
-            token_address=self.config.get_token_address()
+            token_address=self.config.get_token_address(),
+            state_dir=self.config.get_analytics_state_dir()
         )
         
         self.historical_tracker = HistoricalTracker()
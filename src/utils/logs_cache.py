@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Logs Cache
+Persists eth_getLogs results for finalized block ranges so repeated scans skip the RPC
+"""
+
+import gzip
+import json
+import time
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from hexbytes import HexBytes
+
+# Seconds between accessed_at updates for a hit entry; eviction only needs coarse recency
+ACCESS_TOUCH_INTERVAL = 3600
+
+
+class LogsCache:
+    """SQLite-backed cache of formatted logs for block ranges that can no longer change."""
+
+    def __init__(self, db_path: str = "data/cache/logs_cache.db", max_size_mb: int = 256):
+        """
+        Initialize the logs cache.
+
+        Args:
+            db_path: Path to SQLite database file
+            max_size_mb: Total compressed payload size kept before evicting least recently used ranges
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size_mb * 1024 * 1024
+        self.logger = logging.getLogger(__name__)
+        # Serializes writers; reads go straight to each thread's connection
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._init_database()
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's database connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.db_path, timeout=5)
+        return conn
+
+    def _init_database(self) -> None:
+        """Create the cache table if needed."""
+        with self._connection() as conn:
+            # WAL lets readers on other threads' connections run alongside a writer (persistent)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS logs_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_logs_cache_accessed ON logs_cache(accessed_at)')
+
+    def get(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get cached logs for a request.
+
+        Args:
+            cache_key: Key identifying the address, topics and block range
+
+        Returns:
+            List of formatted logs, or None if the range is not cached
+        """
+        try:
+            conn = self._connection()
+            row = conn.execute('SELECT payload, accessed_at FROM logs_cache WHERE cache_key = ?', (cache_key,)).fetchone()
+            if row is None:
+                return None
+
+            payload, accessed_at = row
+            now = time.time()
+            if now - accessed_at > ACCESS_TOUCH_INTERVAL:
+                with self._lock, conn:
+                    conn.execute('UPDATE logs_cache SET accessed_at = ? WHERE cache_key = ?', (now, cache_key))
+
+            logs = json.loads(gzip.decompress(payload))
+            for log in logs:
+                # Same type web3 returns on a miss
+                log['data'] = HexBytes(bytes.fromhex(log['data']))
+            return logs
+        except (sqlite3.Error, OSError, ValueError) as e:
+            self.logger.warning(f"Error reading logs cache: {e}")
+            return None
+
+    def put(self, cache_key: str, logs: List[Dict[str, Any]]) -> None:
+        """
+        Store logs for a finalized block range, evicting the least recently used ranges if over size.
+
+        Args:
+            cache_key: Key identifying the address, topics and block range
+            logs: Formatted logs returned for the range
+        """
+        try:
+            serializable = [{**log, 'data': bytes(log['data']).hex()} for log in logs]
+            payload = gzip.compress(json.dumps(serializable, separators=(',', ':')).encode(), compresslevel=6)
+
+            conn = self._connection()
+            with self._lock, conn:
+                conn.execute(
+                    'INSERT OR REPLACE INTO logs_cache (cache_key, payload, size, accessed_at) VALUES (?, ?, ?, ?)',
+                    (cache_key, payload, len(payload), time.time())
+                )
+
+                total_size = conn.execute('SELECT COALESCE(SUM(size), 0) FROM logs_cache').fetchone()[0]
+                if total_size > self.max_size:
+                    self._evict(conn, total_size - self.max_size)
+        except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+            self.logger.warning(f"Error writing logs cache: {e}")
+
+    def _evict(self, conn: sqlite3.Connection, excess: int) -> None:
+        """Delete least recently used entries until at least `excess` bytes are freed."""
+        freed = 0
+        stale_keys = []
+        for cache_key, size in conn.execute('SELECT cache_key, size FROM logs_cache ORDER BY accessed_at'):
+            if freed >= excess:
+                break
+            stale_keys.append((cache_key,))
+            freed += size
+
+        conn.executemany('DELETE FROM logs_cache WHERE cache_key = ?', stale_keys)
+        self.logger.info(f"Evicted {len(stale_keys)} cached log ranges ({freed} bytes)")
@@ -5,6 +5,7 @@ RPC Rate Limit List - Manages temporarily rate-limited RPC endpoints.
 import json
 import time
 import logging
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List, Optional
@@ -25,6 +26,8 @@ class RPCRateLimitList:
         self.rate_limit_file.parent.mkdir(parents=True, exist_ok=True)
         self.cooldown_seconds = cooldown_minutes * 60
         self.logger = logging.getLogger(__name__)
+        # Providers are checked and marked from concurrent request threads
+        self._lock = threading.Lock()
         self._rate_limited_endpoints: Dict[str, Dict[str, Any]] = self._load_rate_limit_list()
         self.logger.info(f"Loaded {len(self._rate_limited_endpoints)} rate-limited RPC endpoints")
     
@@ -41,7 +44,7 @@ class RPCRateLimitList:
                 current_time = time.time()
                 active_rate_limited = {
                     url: info for url, info in data.get('rate_limited_endpoints', {}).items()
-                    if (current_time - info.get('timestamp', 0)) < self.cooldown_seconds
+                    if current_time < self._cooldown_until(info)
                 }
                 return active_rate_limited
         except (json.JSONDecodeError, FileNotFoundError, KeyError) as e:
@@ -49,7 +52,7 @@ class RPCRateLimitList:
             return {}
     
     def _save_rate_limit_list(self) -> None:
-        """Save the current rate limit list to a JSON file."""
+        """Save the current rate limit list to a JSON file (call with self._lock held)."""
         try:
             data = {
                 'rate_limited_endpoints': self._rate_limited_endpoints,
@@ -62,57 +65,75 @@ class RPCRateLimitList:
         except Exception as e:
             self.logger.error(f"Error saving rate limit list: {e}")
     
-    def add_rate_limited_endpoint(self, url: str, error_code: Optional[int] = None, error_message: Optional[str] = None) -> None:
-        """Add a rate-limited RPC endpoint to the rate limit list."""
+    def _cooldown_until(self, info: Dict[str, Any]) -> float:
+        """Get when an entry's cooldown ends (entries without cooldown_until use the default cooldown)."""
+        return info.get('cooldown_until', info.get('timestamp', 0) + self.cooldown_seconds)
+    
+    def add_rate_limited_endpoint(self, url: str, error_code: Optional[int] = None, error_message: Optional[str] = None,
+                                  cooldown_seconds: Optional[float] = None) -> None:
+        """
+        Add a rate-limited RPC endpoint to the rate limit list.
+        
+        Args:
+            url: RPC endpoint URL
+            error_code: HTTP status code that triggered the cooldown
+            error_message: Error message from the failed request
+            cooldown_seconds: Cooldown to apply instead of the default (e.g. from a Retry-After header)
+        """
         self.logger.warning(f"Added rate-limited RPC endpoint to cooldown list: {url}")
         if error_code:
             self.logger.warning(f"  Error code: {error_code}")
         if error_message:
             self.logger.warning(f"  Error message: {error_message}")
         
-        self._rate_limited_endpoints[url] = {
-            'timestamp': time.time(),
-            'rate_limited_at': datetime.now().isoformat(),
-            'error_code': error_code,
-            'error_message': error_message,
-            'cooldown_until': time.time() + self.cooldown_seconds
-        }
-        self._save_rate_limit_list()
+        with self._lock:
+            self._rate_limited_endpoints[url] = {
+                'timestamp': time.time(),
+                'rate_limited_at': datetime.now().isoformat(),
+                'error_code': error_code,
+                'error_message': error_message,
+                'cooldown_until': time.time() + (self.cooldown_seconds if cooldown_seconds is None else cooldown_seconds)
+            }
+            self._save_rate_limit_list()
     
     def is_rate_limited(self, url: str) -> bool:
         """Check if an RPC endpoint is currently rate limited."""
-        if url in self._rate_limited_endpoints:
-            # Check if the cooldown period has passed
-            rate_limited_time = self._rate_limited_endpoints[url].get('timestamp', 0)
-            if (time.time() - rate_limited_time) < self.cooldown_seconds:
-                return True
-            else:
-                # Remove expired entry
-                del self._rate_limited_endpoints[url]
-                self._save_rate_limit_list()
+        with self._lock:
+            info = self._rate_limited_endpoints.get(url)
+            if info is not None:
+                # Check if the cooldown period has passed
+                if time.time() < self._cooldown_until(info):
+                    return True
+                else:
+                    # Remove expired entry
+                    self._rate_limited_endpoints.pop(url, None)
+                    self._save_rate_limit_list()
         return False
     
     def clear_rate_limit_list(self) -> None:
         """Clear all entries from the rate limit list."""
-        self._rate_limited_endpoints = {}
-        self._save_rate_limit_list()
+        with self._lock:
+            self._rate_limited_endpoints = {}
+            self._save_rate_limit_list()
         self.logger.info("Cleared RPC rate limit list")
     
     def get_rate_limit_list_info(self) -> Dict[str, Any]:
         """Get information about the current rate limit list."""
         self._load_rate_limit_list()  # Ensure expired entries are removed
+        with self._lock:
+            endpoints = list(self._rate_limited_endpoints.keys())
         return {
-            'total_rate_limited': len(self._rate_limited_endpoints),
+            'total_rate_limited': len(endpoints),
             'last_updated': datetime.now().isoformat(),
             'cooldown_minutes': self.cooldown_seconds / 60,
-            'rate_limited_endpoints': list(self._rate_limited_endpoints.keys())
+            'rate_limited_endpoints': endpoints
         }
     
     def get_cooldown_remaining(self, url: str) -> Optional[int]:
         """Get remaining cooldown time in seconds for a rate-limited endpoint."""
-        if url in self._rate_limited_endpoints:
-            rate_limited_time = self._rate_limited_endpoints[url].get('timestamp', 0)
-            remaining = self.cooldown_seconds - (time.time() - rate_limited_time)
+        info = self._rate_limited_endpoints.get(url)
+        if info is not None:
+            remaining = self._cooldown_until(info) - time.time()
             return max(0, int(remaining))
         return None
 
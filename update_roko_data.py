@@ -4,9 +4,12 @@ Simple script to update ROKO data for web delivery.
 Designed to be called from a cronjob.
 """
 
+import os
+import gzip
 import json
 import time
 import sys
+import tempfile
 import logging
 import argparse
 from datetime import datetime, timezone
@@ -232,6 +235,18 @@ def extract_roko_data():
             'status': 'error'
         }
 
+def write_file_atomic(path, payload: bytes):
+    """Write a file via a temp file in the same directory and rename, so readers never see it half-written."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+    try:
+        os.fchmod(fd, 0o644)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 def save_web_data(data, output_dir="web_delivery", filename="latest.json", create_timestamped=True):
     """Save data to web delivery directory."""
     logger = logging.getLogger(__name__)
@@ -241,10 +256,15 @@ def save_web_data(data, output_dir="web_delivery", filename="latest.json", creat
         web_dir = Path(output_dir)
         web_dir.mkdir(parents=True, exist_ok=True)
         
-        # Save main data file
+        # Serialize and compress once; the same bytes are reused for the timestamped copy
+        content = json.dumps(data, indent=2).encode()
+        compressed = gzip.compress(content, compresslevel=6)
+        
+        # Save main data file, then a precompressed copy for the web server to send to
+        # gzip-capable clients (written second so it is never older than the JSON)
         main_filepath = web_dir / filename
-        with open(main_filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_file_atomic(main_filepath, content)
+        write_file_atomic(f"{main_filepath}.gz", compressed)
         
         logger.info(f"Main data saved to: {main_filepath}")
         
@@ -253,8 +273,8 @@ def save_web_data(data, output_dir="web_delivery", filename="latest.json", creat
             timestamp = datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')
             timestamped_filename = f"roko_data_{timestamp}.json"
             timestamped_filepath = web_dir / timestamped_filename
-            with open(timestamped_filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            write_file_atomic(timestamped_filepath, content)
+            write_file_atomic(f"{timestamped_filepath}.gz", compressed)
             logger.info(f"Timestamped data saved to: {timestamped_filepath}")
         
         return str(main_filepath)